@@ -0,0 +1,305 @@
+"""
+Headless rendering benchmarks for the scenes and components of the game.
+
+Runs the controller with the dummy SDL video and audio drivers, drives every
+scene for a number of frames with scripted mouse motion and reports frame
+time statistics and Python allocations per scene, plus micro-benchmarks of
+the components, as JSON.
+
+Usage (from the root of the project):
+    python benchmarks/render.py --frames 300 --output bench.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)
+
+import pygame as pyg
+import source
+import source.scenes
+from source.components import Button, Dropdown, Image, Text
+from source.constants import Colors, GameConfig
+from source.frame_timer import FrameTimer
+
+SCENE_IDS: list[str] = [
+    "intro",
+    "main_menu",
+    "settings_scene",
+    "music_settings_scene",
+    "language_settings_scene",
+    "multiplayer_menu_scene",
+    "create_room_scene",
+]
+
+
+def create_controller() -> source.Controller:
+    """
+    Create a controller with every scene of the game, as main.py does.
+    """
+    # the dummy video driver has no system cursors
+    pyg.mouse.set_cursor = lambda *args, **kwargs: None
+    controller = source.Controller()
+    controller.debug = False
+    controller.set()
+    controller.resource_loader.wait()
+    controller.populate(
+        [
+            source.scenes.IntroScene(controller),
+            source.scenes.MainMenuScene(controller),
+            source.scenes.SettingsMenuScene(controller),
+            source.scenes.MusicSettingsScene(controller),
+            source.scenes.MultiplayerMenuScene(controller),
+            source.scenes.LanguageSettingsScene(controller),
+            source.scenes.CreateMenuScene(controller),
+        ]
+    )
+    # the intro would otherwise change to the main menu after a few seconds
+    controller.scenes["intro"].max_time = float("inf")
+    return controller
+
+
+def mouse_path(frame: int, size: tuple[int, int]) -> tuple[int, int]:
+    """
+    Get the scripted mouse position for a frame: a zigzag over the screen.
+    """
+    width, height = size
+    x = (frame * 37) % width
+    y = (frame * 11) % height
+    return x, y
+
+
+def run_frames(controller: source.Controller, frames: int) -> None:
+    """
+    Run frames of the current scene, moving the mouse on each one.
+    """
+    screen_size = controller.screen.get_size()
+    for frame in range(frames):
+        position = mouse_path(frame, screen_size)
+        pyg.event.post(
+            pyg.event.Event(
+                pyg.MOUSEMOTION, pos=position, rel=(0, 0), buttons=(0, 0, 0)
+            )
+        )
+        controller.frame_timer.begin(controller.scene_id)
+        controller.event_handler()
+        controller.frame_timer.lap("events")
+        dirty_rects = controller.update(1 / GameConfig.FPS)
+        controller.refresh_display(dirty_rects)
+        controller.frame_timer.lap("display")
+        controller.frame_timer.end()
+
+
+def enter_scene(controller: source.Controller, scene_id: str) -> None:
+    """
+    Enter a scene, from the start if it is already the current one.
+    """
+    if controller.scene_id == scene_id:
+        controller.current_scene.on_exit()
+        controller.current_scene.prepare()
+        controller.current_scene.on_enter()
+        controller.current_scene.invalidate()
+    else:
+        controller.change_scene(scene_id)
+
+
+def bench_scenes(controller: source.Controller, frames: int) -> dict:
+    """
+    Benchmark every scene for the given number of frames.
+
+    Returns:
+        dict: The frame timings and allocations of each scene.
+    """
+    results = {}
+    for scene_id in SCENE_IDS:
+        controller.frame_timer.clear()
+        enter_scene(controller, scene_id)
+        run_frames(controller, frames)
+        timings = controller.frame_timer.summary(scene_id)[scene_id]
+
+        # allocations are measured in a second pass, tracemalloc skews timings
+        enter_scene(controller, scene_id)
+        tracemalloc.start()
+        run_frames(controller, frames)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[scene_id] = {
+            "timings_ms": timings,
+            "allocated_bytes": current,
+            "peak_allocated_bytes": peak,
+        }
+    return results
+
+
+def measure(action: callable, iterations: int) -> dict:
+    """
+    Measure the time of calling an action repeatedly.
+
+    Returns:
+        dict: The statistics of the calls, in microseconds.
+    """
+    samples = []
+    for _ in range(iterations):
+        start = perf_counter()
+        action()
+        samples.append(perf_counter() - start)
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "mean_us": sum(samples) / len(samples) * 1e6,
+        "p50_us": FrameTimer.percentile(samples, 50) * 1e6,
+        "p95_us": FrameTimer.percentile(samples, 95) * 1e6,
+        "p99_us": FrameTimer.percentile(samples, 99) * 1e6,
+    }
+
+
+def bench_components(controller: source.Controller, iterations: int) -> dict:
+    """
+    Benchmark the drawing and updating of single components.
+
+    Returns:
+        dict: The statistics of each micro-benchmark.
+    """
+    scene = controller.scenes["main_menu"]
+    screen = controller.screen
+    font = controller.resource_loader.get_font(size=24)
+    button = Button(
+        scene=scene,
+        name="bench_btn",
+        text="Benchmark",
+        font=font,
+        font_size=24,
+        font_color=Colors.WHITE,
+        action=None,
+        position=(300, 300),
+        size=(200, 50),
+        color=Colors.BLUE,
+    )
+    dropdown = Dropdown(
+        scene=scene,
+        size=(200, 50),
+        name="bench_dropdown",
+        items=GameConfig.LANGUAGES,
+        position=(300, 100),
+        font=font,
+    )
+    image = Image(
+        image=controller.resource_loader.images["logo"],
+        scene=scene,
+        name="bench_logo",
+        position=(200, 50),
+        size=(400, 200),
+    )
+    text = Text(
+        text="Benchmark",
+        font=font,
+        font_size=24,
+        font_color=Colors.WHITE,
+        scene=scene,
+        name="bench_text",
+        position=(300, 400),
+        size=(200, 50),
+    )
+    texts = [f"Benchmark {index}" for index in range(8)]
+
+    results = {"button.draw": measure(lambda: button.draw(screen), iterations)}
+    button.is_hovered = True
+    results["button.draw_hovered"] = measure(lambda: button.draw(screen), iterations)
+    results["dropdown.draw_collapsed"] = measure(
+        lambda: dropdown.draw(screen), iterations
+    )
+    dropdown.expanded = True
+    results["dropdown.draw_expanded"] = measure(
+        lambda: dropdown.draw(screen), iterations
+    )
+    results["image.rescale"] = measure(lambda: image.rescale((400, 200)), iterations)
+    counter = iter(range(iterations))
+    results["text.set_text"] = measure(
+        lambda: text.set_text(texts[next(counter) % len(texts)]), iterations
+    )
+    return results
+
+
+def bench_blits(controller: source.Controller, iterations: int) -> dict:
+    """
+    Benchmark blitting the images of the game as decoded, before converting
+    them to the display format, and after.
+
+    Returns:
+        dict: The statistics of the blits of each image, before and after.
+    """
+    loader = controller.resource_loader
+    screen = controller.screen
+    paths = {
+        **loader.image_paths,
+        "planet": os.path.join(
+            source.constants.ResourceConfig.PLANETS_DIR,
+            next(iter(source.constants.ResourceConfig.PLANETS.values())),
+        ),
+    }
+    results = {}
+    for key, path in paths.items():
+        raw = loader.load_image(path)
+        converted = loader.prepare_image(raw)
+        results[key] = {
+            "raw": measure(lambda: screen.blit(raw, (0, 0)), iterations),
+            "converted": measure(lambda: screen.blit(converted, (0, 0)), iterations),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300, help="frames per scene")
+    parser.add_argument(
+        "--iterations", type=int, default=1000, help="calls per micro-benchmark"
+    )
+    parser.add_argument(
+        "--dirty", action="store_true", help="enable dirty-rect rendering"
+    )
+    parser.add_argument("--output", help="file to write the results to")
+    args = parser.parse_args()
+
+    controller = create_controller()
+    controller.dirty_rendering = args.dirty
+    controller.current_scene.prepare()
+    controller.current_scene.on_enter()
+    results = {
+        "version": GameConfig.VERSION,
+        "python": platform.python_version(),
+        "pygame": pyg.version.ver,
+        "timestamp": time.time(),
+        "frames": args.frames,
+        "dirty_rendering": controller.dirty_rendering,
+        "scenes": bench_scenes(controller, args.frames),
+        "components": bench_components(controller, args.iterations),
+        "blits": bench_blits(controller, args.iterations),
+        "text_cache": source.components.text_cache.stats,
+        "images": controller.resource_loader.image_stats,
+        "conversion": controller.resource_loader.conversion_stats,
+        "sounds": controller.resource_loader.sounds.stats,
+    }
+    pyg.quit()
+
+    output = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,79 @@
 """
 This is the main file of the project. It is used to run the controller.
+
+Run with --profile-startup to log the time spent in each import, each step
+of Controller.set and each scene constructor once the first frame is shown.
 """
 
-import source
-import source.scenes
+import sys
+import argparse
+import builtins
+from time import perf_counter
+
+START_TIME = perf_counter()
+import_timings: dict[str, float] = {}
+# time spent in the imports nested in each import in progress
+import_stack: list[float] = []
+original_import = builtins.__import__
+
+
+def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """
+    Import a module as `__import__` does, recording the time of its first
+    import, excluding the modules it imports in turn.
+    """
+    if level and globals:
+        package = globals.get("__package__") or ""
+        base = package.rsplit(".", level - 1)[0]
+        module = f"{base}.{name}" if name else base
+    else:
+        module = name
+    if module in sys.modules:
+        return original_import(name, globals, locals, fromlist, level)
+    start = perf_counter()
+    import_stack.append(0.0)
+    try:
+        return original_import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = perf_counter() - start
+        nested = import_stack.pop()
+        if import_stack:
+            import_stack[-1] += elapsed
+        import_timings.setdefault(module, elapsed - nested)
+
 
 if __name__ == "__main__":
-    controller = source.Controller()
+    parser = argparse.ArgumentParser(description="Run the game.")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="log the time of each startup step once the first frame is shown",
+    )
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        builtins.__import__ = timed_import
+    import source
+    import source.scenes
+    from source.startup_profiler import StartupProfiler
+
+    builtins.__import__ = original_import
+
+    profiler = StartupProfiler(origin=START_TIME, enabled=args.profile_startup)
+    for module, seconds in import_timings.items():
+        profiler.record("import", module, seconds)
+    controller = source.Controller(startup_profiler=profiler)
     controller.set()
+    # the scenes are only created when they are first shown
     controller.populate(
-        [
-            source.scenes.IntroScene(controller),
-            source.scenes.MainMenuScene(controller),
-            source.scenes.SettingsMenuScene(controller),
-            source.scenes.MusicSettingsScene(controller),
-            source.scenes.MultiplayerMenuScene(controller),
-            source.scenes.LanguageSettingsScene(controller),
-            source.scenes.CreateMenuScene(controller),
-        ]
+        factories={
+            "intro": source.scenes.IntroScene,
+            "main_menu": source.scenes.MainMenuScene,
+            "settings_scene": source.scenes.SettingsMenuScene,
+            "music_settings_scene": source.scenes.MusicSettingsScene,
+            "multiplayer_menu_scene": source.scenes.MultiplayerMenuScene,
+            "language_settings_scene": source.scenes.LanguageSettingsScene,
+            "create_room_scene": source.scenes.CreateMenuScene,
+        }
     )
     controller.start()
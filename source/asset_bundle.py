@@ -0,0 +1,178 @@
+"""
+This module contains the asset bundle format: a single file with every resource of the game.
+
+Layout of a bundle:
+    - magic (4 bytes): b"UCB1"
+    - index length (4 bytes, little-endian unsigned int)
+    - index: UTF-8 JSON object mapping each resource name (its path relative
+      to the resources directory, with forward slashes) to its offset, length
+      and SHA-256 hash
+    - the contents of the resources, one after the other
+
+Build a bundle with:
+    python tools/pack_assets.py resources resources.bundle
+"""
+
+import os
+import json
+import mmap
+import struct
+import hashlib
+from .logger import get_logger
+
+MAGIC: bytes = b"UCB1"
+HEADER: struct.Struct = struct.Struct("<4sI")
+
+
+class AssetBundle:
+    """
+    A read-only asset bundle, memory-mapped so its entries are read straight
+    from the mapping without opening a file per resource.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Open an asset bundle.
+
+        Args:
+            filename (str): The path of the bundle.
+
+        Raises:
+            ValueError: If the file is not a valid bundle, or is truncated.
+            OSError: If the file can't be read.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.filename: str = filename
+        self.built: int = os.stat(filename).st_mtime_ns
+        with open(filename, "rb") as file:
+            self.mapping: mmap.mmap = mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        self.view: memoryview = memoryview(self.mapping)
+        try:
+            magic, index_length = HEADER.unpack_from(self.mapping)
+        except struct.error:
+            magic, index_length = None, 0
+        if magic != MAGIC:
+            self.close()
+            msg = f"'{filename}' is not an asset bundle."
+            self.logger.error(msg)
+            raise ValueError(msg)
+        index = self.view[HEADER.size : HEADER.size + index_length]
+        try:
+            self.entries: dict[str, dict] = json.loads(bytes(index).decode("utf-8"))
+        except ValueError:
+            self.entries = None
+        finally:
+            index.release()
+        # a truncated bundle has entries past its end
+        if not isinstance(self.entries, dict) or any(
+            entry["offset"] + entry["length"] > len(self.mapping)
+            for entry in self.entries.values()
+        ):
+            self.close()
+            msg = f"'{filename}' is truncated or corrupted."
+            self.logger.error(msg)
+            raise ValueError(msg)
+        self.logger.info(f"Opened {filename} ({len(self.entries)} entries).")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def get(self, name: str) -> memoryview:
+        """
+        Get the contents of an entry, without copying them.
+
+        Args:
+            name (str): The name of the entry. Eg. "planets/earth.png".
+
+        Returns:
+            memoryview: A view of the contents in the mapping.
+        """
+        entry = self.entries[name]
+        return self.view[entry["offset"] : entry["offset"] + entry["length"]]
+
+    def is_outdated(self, path: str) -> bool:
+        """
+        Check if the loose file of an entry changed after the bundle was built,
+        in which case the file should be used instead of the entry.
+
+        Args:
+            path (str): The path of the loose file.
+
+        Returns:
+            bool: True if the file is newer than the bundle.
+        """
+        try:
+            return os.stat(path).st_mtime_ns > self.built
+        except OSError:
+            return False
+
+    def verify(self, name: str) -> bool:
+        """
+        Check the contents of an entry against the hash stored in the index.
+
+        Args:
+            name (str): The name of the entry.
+
+        Returns:
+            bool: True if the contents are intact, False otherwise.
+        """
+        return (
+            hashlib.sha256(self.get(name)).hexdigest() == self.entries[name]["sha256"]
+        )
+
+    def close(self) -> None:
+        """
+        Close the bundle. Views returned by `get` must be released before.
+        """
+        self.view.release()
+        self.mapping.close()
+
+
+def pack(resource_dir: str, filename: str) -> dict[str, dict]:
+    """
+    Write every file under a directory into a bundle.
+
+    Args:
+        resource_dir (str): The directory with the resources.
+        filename (str): The path of the bundle to write.
+
+    Returns:
+        dict[str, dict]: The index of the bundle.
+    """
+    contents = {}
+    for root, dirs, files in os.walk(resource_dir):
+        # walked in order, so the same resources always give the same bundle
+        dirs.sort()
+        for file in sorted(files):
+            path = os.path.join(root, file)
+            if os.path.abspath(path) == os.path.abspath(filename):
+                continue
+            name = os.path.relpath(path, resource_dir).replace(os.sep, "/")
+            with open(path, "rb") as resource:
+                contents[name] = resource.read()
+
+    # the offsets depend on the size of the index, which depends on the offsets
+    index = {}
+    index_length = 0
+    while True:
+        offset = HEADER.size + index_length
+        for name, data in contents.items():
+            index[name] = {
+                "offset": offset,
+                "length": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+            }
+            offset += len(data)
+        encoded = json.dumps(index, sort_keys=True).encode("utf-8")
+        if len(encoded) == index_length:
+            break
+        index_length = len(encoded)
+
+    with open(filename, "wb") as bundle:
+        bundle.write(HEADER.pack(MAGIC, len(encoded)))
+        bundle.write(encoded)
+        for data in contents.values():
+            bundle.write(data)
+    return index
@@ -2,5 +2,6 @@ from .button import Button
 from .text import Text
 from .image import Image
 from .dropdown import Dropdown
+from .text_cache import TextCache, text_cache
 
-__all__ = ["Button", "Text", "Image", "Dropdown"]
+__all__ = ["Button", "Text", "Image", "Dropdown", "TextCache", "text_cache"]
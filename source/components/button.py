@@ -4,6 +4,7 @@ This module contains the Button class.
 
 import pygame as pyg
 from .component import Component
+from .text_cache import render_text
 
 
 class Button(Component):
@@ -11,6 +12,8 @@ class Button(Component):
     A button component.
     """
 
+    event_types: tuple[int, ...] = (pyg.MOUSEMOTION, pyg.MOUSEBUTTONDOWN)
+
     def __init__(
         self,
         text: str,
@@ -38,8 +41,8 @@ class Button(Component):
         self.font: pyg.font.Font = font
         self.font_size: int = font_size
         self.font_color: tuple[int, int, int] = font_color
-        self.font_object: pyg.Surface = self.font.render(
-            self.text, True, self.font_color
+        self.font_object: pyg.Surface = render_text(
+            self.font, self.text, self.font_color
         )
         self.font_rect: pyg.Rect = self.font_object.get_rect(center=self.rect.center)
         self.action = action or (lambda: None)
@@ -53,8 +56,15 @@ class Button(Component):
     @textContent.setter
     def textContent(self, value: str) -> None:
         self.text = value
-        self.font_object = self.font.render(self.text, True, self.font_color)
+        self.font_object = render_text(self.font, self.text, self.font_color)
         self.font_rect = self.font_object.get_rect(center=self.rect.center)
+        self.mark_changed()
+
+    def get_bounds(self) -> pyg.Rect:
+        """
+        Get the area of the screen the button draws on, including its label.
+        """
+        return self.rect.union(self.font_rect)
 
     def draw(self, screen: pyg.Surface) -> None:
         """
@@ -63,15 +73,18 @@ class Button(Component):
         super().draw(screen)
         if self.is_hovered:
             pyg.draw.rect(screen, self.color, self.rect)
-            if not self.previous_hover_state:
-                pyg.mouse.set_cursor(pyg.SYSTEM_CURSOR_HAND)
         else:
             pyg.draw.rect(screen, self.color, self.rect, 2)
-            if self.previous_hover_state:
-                pyg.mouse.set_cursor(pyg.SYSTEM_CURSOR_ARROW)
-
         screen.blit(self.font_object, self.font_rect)
-        self.previous_hover_state = self.is_hovered
+
+    def _check_hover(self, position: tuple[int, int]) -> None:
+        super()._check_hover(position)
+        # a static button is not drawn every frame, so the cursor is updated here
+        if self.is_hovered != self.previous_hover_state:
+            pyg.mouse.set_cursor(
+                pyg.SYSTEM_CURSOR_HAND if self.is_hovered else pyg.SYSTEM_CURSOR_ARROW
+            )
+            self.previous_hover_state = self.is_hovered
 
     def handle_event(self, event: pyg.event.Event) -> None:
         super().handle_event(event)
@@ -14,6 +14,9 @@ class Component:
     A component is a part of a scene that can be drawn on the screen.
     """
 
+    # the types of the events handled by the component
+    event_types: tuple[int, ...] = (pyg.MOUSEMOTION,)
+
     def __init__(
         self,
         scene: Scene,
@@ -47,6 +50,8 @@ class Component:
         self.debug = debug
         self.is_hovered = False
         self.was_hovered = False
+        self.scene.invalidate_layer()
+        self.scene.invalidate_hit_grid()
 
     def draw(self, screen: pyg.Surface) -> None:
         """
@@ -58,6 +63,49 @@ class Component:
         if not self.visible:
             return
 
+    def get_bounds(self) -> pyg.Rect:
+        """
+        Get the area of the screen the component draws on.
+
+        Returns:
+            pyg.Rect: The area covered by the component.
+        """
+        return self.rect
+
+    def is_static(self) -> bool:
+        """
+        Check if the component looks as it does at rest, so it can be cached
+        in the static layer of the scene.
+
+        Returns:
+            bool: True if the component is static, False otherwise.
+        """
+        return self.visible and not self.is_hovered
+
+    def captures_pointer(self) -> bool:
+        """
+        Check if the component must receive every pointer event, even the
+        ones outside of it (eg. to close when clicking elsewhere).
+
+        Returns:
+            bool: True if the component captures the pointer, False otherwise.
+        """
+        return False
+
+    def mark_dirty(self) -> None:
+        """
+        Mark the area of the component as changed so the scene redraws it.
+        """
+        self.scene.mark_dirty(self.get_bounds())
+
+    def mark_changed(self) -> None:
+        """
+        Mark the component as changed at rest (eg. a new text or size), so the
+        static layer and the hit-testing grid of the scene are rebuilt.
+        """
+        self.scene.invalidate_layer()
+        self.scene.invalidate_hit_grid()
+
     def collidepoint(self, point: tuple[int, int]) -> bool:
         """
         Check if a point is inside the component.
@@ -70,6 +118,16 @@ class Component:
         """
         return self.rect.collidepoint(point)
 
+    def sync_hover(self, position: tuple[int, int]) -> None:
+        """
+        Update the hover state to the given mouse position.
+        Eg. when the scene of the component is entered again.
+
+        Args:
+            position (tuple[int, int]): The position of the mouse.
+        """
+        self._check_hover(position)
+
     def _check_hover(self, position: tuple[int, int]) -> None:
         """
         Check if the mouse is hovering over the component.
@@ -79,6 +137,7 @@ class Component:
         """
         self.is_hovered = self.rect.collidepoint(position)
         if self.is_hovered != self.was_hovered:
+            self.mark_dirty()
             if self.is_hovered:
                 self.log("Hovering over the component.")
             elif not self.is_hovered:
@@ -95,12 +154,13 @@ class Component:
         if event.type == pyg.MOUSEMOTION:
             self._check_hover(position=event.pos)
 
-    def log(self, message: str) -> None:
+    def log(self, message: str, *args) -> None:
         """
         Log a debug message if debugging is enabled.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, a %-style template if args are given.
+            args: The values of the template, only formatted if the message is written.
         """
         if self.debug:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
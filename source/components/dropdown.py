@@ -1,5 +1,6 @@
 import pygame as pyg
 from .component import Component
+from .text_cache import render_text
 from ..scene import Scene
 from ..constants import Colors
 
@@ -9,6 +10,8 @@ class Dropdown(Component):
     A dropdown component that allows selecting an item from a dictionary.
     """
 
+    event_types: tuple[int, ...] = (pyg.MOUSEMOTION, pyg.MOUSEBUTTONDOWN)
+
     def __init__(
         self,
         scene: Scene,
@@ -50,10 +53,53 @@ class Dropdown(Component):
         self.action: callable = action
         self.selected_color: tuple[int, int, int] = selected_color
         self.font_color: tuple[int, int, int] = font_color
-        self.font = font or pyg.font.Font(None, 24)
+        self.font = font or scene.controller.resource_loader.get_font(size=24)
         self.selected_key = selected_key or next(iter(self.items.keys()))
         self.expanded = False
 
+    def get_bounds(self) -> pyg.Rect:
+        """
+        Get the area of the screen the dropdown draws on, including the
+        item list when it is expanded.
+
+        Returns:
+            pyg.Rect: The area covered by the dropdown.
+        """
+        if not self.expanded:
+            return self.rect
+        return self.rect.union(self.rect.move(0, len(self.items) * self.rect.height))
+
+    def is_static(self) -> bool:
+        """
+        Check if the dropdown is collapsed, so it can be cached in the static
+        layer of the scene.
+        """
+        return self.visible and not self.expanded
+
+    def captures_pointer(self) -> bool:
+        """
+        Check if the dropdown is expanded, so it gets the clicks outside of it.
+        """
+        return self.expanded
+
+    def item_at(self, position: tuple[int, int]) -> str | None:
+        """
+        Get the item of the expanded list under a position.
+
+        Args:
+            position (tuple[int, int]): The position to check.
+
+        Returns:
+            str | None: The key of the item, or None if there is no item there.
+        """
+        x, y = position
+        if not self.rect.left <= x < self.rect.right or y < self.rect.bottom:
+            return None
+        index = (y - self.rect.bottom) // self.rect.height
+        if index >= len(self.items):
+            return None
+        return list(self.items)[index]
+
     def draw(self, screen: pyg.Surface) -> None:
         """
         Draw the dropdown on the screen.
@@ -65,7 +111,7 @@ class Dropdown(Component):
             return
         pyg.draw.rect(screen, self.selected_color, self.rect, 2)
         pyg.draw.rect(screen, self.color, self.rect.inflate(-4, -4))
-        text = self.font.render(self.items[self.selected_key], True, self.font_color)
+        text = render_text(self.font, self.items[self.selected_key], self.font_color)
         text_rect = text.get_rect(center=(self.rect.centerx, self.rect.centery))
         screen.blit(text, text_rect)
 
@@ -73,12 +119,7 @@ class Dropdown(Component):
             # Draw the dropdown items
             mouse_pos = pyg.mouse.get_pos()
             for i, (key, item) in enumerate(self.items.items()):
-                item_rect = pyg.Rect(
-                    self.rect.x,
-                    self.rect.y + (i + 1) * self.rect.height,
-                    self.rect.width,
-                    self.rect.height,
-                )
+                item_rect = self.rect.move(0, (i + 1) * self.rect.height)
                 # Check if mouse is over the item
                 if item_rect.collidepoint(mouse_pos):
                     item_bg_color = self.selected_color
@@ -92,7 +133,7 @@ class Dropdown(Component):
                     pyg.mouse.set_cursor(pyg.SYSTEM_CURSOR_ARROW)
 
                 pyg.draw.rect(screen, item_bg_color, item_rect)
-                item_text = self.font.render(item, True, self.font_color)
+                item_text = render_text(self.font, item, self.font_color)
                 item_text_rect = item_text.get_rect(
                     center=(item_rect.centerx, item_rect.centery)
                 )
@@ -106,32 +147,29 @@ class Dropdown(Component):
             event (pyg.event.Event): The event to handle.
         """
         super().handle_event(event)
+        if event.type == pyg.MOUSEMOTION and self.expanded:
+            # the highlighted item follows the mouse
+            self.mark_dirty()
         if event.type == pyg.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
                 self.toggle()
             elif self.expanded:
-                clicked_inside = False
-                for i, key in enumerate(self.items.keys()):
-                    item_rect = pyg.Rect(
-                        self.rect.x,
-                        self.rect.y + (i + 1) * self.rect.height,
-                        self.rect.width,
-                        self.rect.height,
-                    )
-                    if item_rect.collidepoint(event.pos):
-                        self.select_item(key)
-                        self.toggle()
-                        clicked_inside = True
-                        break
-                if not clicked_inside:
+                key = self.item_at(event.pos)
+                if key is not None:
+                    self.select_item(key)
+                    self.toggle()
+                else:
+                    self.mark_dirty()
                     self.expanded = False
 
     def toggle(self) -> None:
         """
         Toggle the expanded state of the dropdown.
         """
+        self.mark_dirty()
         self.expanded = not self.expanded
-        self.log(f"Toggled expanded state: {self.expanded}")
+        self.mark_dirty()
+        self.log("Toggled expanded state: %s", self.expanded)
 
     def select_item(self, key: str) -> None:
         """
@@ -141,6 +179,7 @@ class Dropdown(Component):
             key (str): The key of the item to select.
         """
         self.selected_key = key
-        self.log(f"Selected item: {self.items[key]}")
+        self.mark_changed()
+        self.log("Selected item: %s", self.items[key])
         if self.action:
             self.action(key)
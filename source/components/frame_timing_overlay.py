@@ -0,0 +1,97 @@
+"""
+This module contains the FrameTimingOverlay class, which displays the frame timings on screen.
+"""
+
+import pygame as pyg
+from source.logger import get_logger
+from source.constants.colors import Colors
+from source.frame_timer import FrameTimer
+
+
+class FrameTimingOverlay:
+    """
+    A debug overlay showing the percentiles of each phase of a frame for the current scene.
+    """
+
+    def __init__(self, refresh_interval: int = 500):
+        """
+        Initialize the overlay.
+
+        Args:
+            refresh_interval (int, optional): The time between refreshes of the
+                text in milliseconds. Defaults to 500.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.refresh_interval: int = refresh_interval
+        self.font: pyg.font.Font = None
+        self.lines: list[pyg.Surface] = []
+        self.rect: pyg.Rect = None
+        self.last_refresh: int = 0
+        self.visible: bool = False
+
+    def init(self, font: pyg.font.Font = None):
+        """
+        Initialize the overlay.
+
+        Args:
+            font (pyg.font.Font, optional): The font to use. Defaults to the default font.
+        """
+        self.font = font or pyg.font.Font(None, 24)
+
+    def toggle(self) -> None:
+        """
+        Toggle the visibility of the overlay.
+        """
+        self.visible = not self.visible
+        self.last_refresh = 0
+        self.logger.info(f"Overlay {'shown' if self.visible else 'hidden'}.")
+
+    def refresh(self, summary: dict) -> None:
+        """
+        Render the lines of the overlay.
+
+        Args:
+            summary (dict): The summary of a scene, as returned by `FrameTimer.summary`.
+        """
+        # the text changes all the time, so it is not rendered through the text cache
+        self.lines = [
+            self.font.render(
+                f"{phase}: p50 {stats['p50']:.2f} p95 {stats['p95']:.2f} "
+                f"p99 {stats['p99']:.2f} ms",
+                True,
+                Colors.WHITE,
+                Colors.BLACK,
+            )
+            for phase, stats in summary.items()
+        ]
+        height = sum(line.get_height() for line in self.lines)
+        width = max((line.get_width() for line in self.lines), default=0)
+        area = pyg.Rect(10, 10, width, height)
+        self.rect = area.union(self.rect) if self.rect else area
+
+    def update(
+        self, screen: pyg.Surface, timer: FrameTimer, scene_id: str
+    ) -> pyg.Rect | None:
+        """
+        Update the overlay.
+
+        Args:
+            screen (pyg.Surface): The screen to draw the overlay on.
+            timer (FrameTimer): The timer with the recorded frame timings.
+            scene_id (str): The scene whose timings are shown.
+
+        Returns:
+            pyg.Rect | None: The area of the screen the overlay changed,
+                or None if it is not visible.
+        """
+        if not self.visible:
+            return None
+        current_time = pyg.time.get_ticks()
+        if not self.lines or current_time - self.last_refresh > self.refresh_interval:
+            self.refresh(timer.summary(scene_id).get(scene_id, {}))
+            self.last_refresh = current_time
+        y = self.rect.y
+        for line in self.lines:
+            screen.blit(line, (self.rect.x, y))
+            y += line.get_height()
+        return self.rect
@@ -33,8 +33,10 @@ class Image(Component):
         Args:
             size (tuple[int, int]): The new size of the image.
         """
-        self.image = pyg.transform.scale(self.image, size)
+        if self.image.get_size() != tuple(size):
+            self.image = pyg.transform.scale(self.image, size)
         self.rect = self.image.get_rect(center=self.rect.center)
+        self.mark_changed()
 
     def draw(self, screen: pyg.Surface) -> None:
         """
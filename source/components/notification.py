@@ -5,6 +5,7 @@ This module contains the Notification class, which is used to display notificati
 import pygame as pyg
 from source.logger import get_logger
 from source.constants.colors import Colors
+from source.components.text_cache import render_text
 
 
 class Notification:
@@ -27,34 +28,49 @@ class Notification:
         self.font: pyg.font.Font = None
         self.text: pyg.Surface = None
         self.rect: pyg.Rect = None
+        self.area: pyg.Rect = None
         self.start_time: int = 0
         self.visible: bool = False
 
-    def init(self):
+    def init(self, font: pyg.font.Font = None):
         """
         Initialize the notification.
+
+        Args:
+            font (pyg.font.Font, optional): The font to use for the message. Defaults to the default font.
         """
-        self.font = pyg.font.Font(None, 36)
+        self.font = font or pyg.font.Font(None, 36)
         self.logger.info("Initialized.")
 
-    def update(self, screen: pyg.Surface):
+    def update(self, screen: pyg.Surface) -> pyg.Rect | None:
         """
         Update the notification.
+
+        Returns:
+            pyg.Rect | None: The area of the screen the notification changed,
+                or None if it was not visible.
         """
-        if self.visible:
-            current_time = pyg.time.get_ticks()
-            if current_time - self.start_time > self.duration:
-                self.visible = False
-            else:
-                screen.blit(self.text, self.rect)
+        if not self.visible:
+            return None
+        current_time = pyg.time.get_ticks()
+        if current_time - self.start_time > self.duration:
+            self.visible = False
+        else:
+            screen.blit(self.text, self.rect)
+        return self.area
 
     def show(self):
         """
         Show the notification.
         """
-        self.text = self.font.render(self.message, True, Colors.WHITE)
+        self.text = render_text(self.font, self.message, Colors.WHITE)
         self.rect = self.text.get_rect()
         self.rect.center = (pyg.display.get_surface().get_width() // 2, 50)
+        # keep the area of a previous message so it gets cleared too
+        if self.visible and self.area:
+            self.area = self.area.union(self.rect)
+        else:
+            self.area = self.rect.copy()
         self.start_time = pyg.time.get_ticks()
         self.visible = True
         self.logger.info("Notification shown.")
@@ -1,5 +1,6 @@
 import pygame as pyg
 from .component import Component
+from .text_cache import render_text
 
 class Text(Component):
     """
@@ -32,7 +33,7 @@ class Text(Component):
         self.font = font
         self.font_size = font_size
         self.font_color = font_color
-        self.font_object = self.font.render(self.text, True, self.font_color)
+        self.font_object = render_text(self.font, self.text, self.font_color)
         self.font_rect = self.font_object.get_rect(center=self.rect.center)
 
     def draw(self, screen: pyg.Surface) -> None:
@@ -42,6 +43,20 @@ class Text(Component):
         super().draw(screen)
         screen.blit(self.font_object, self.font_rect)
 
+    @property
+    def textContent(self) -> str:
+        return self.text
+
+    @textContent.setter
+    def textContent(self, value: str) -> None:
+        self.set_text(value)
+
+    def get_bounds(self) -> pyg.Rect:
+        """
+        Get the area of the screen the text draws on.
+        """
+        return self.rect.union(self.font_rect)
+
     def set_text(self, text: str) -> None:
         """
         Set the text of the component.
@@ -50,5 +65,6 @@ class Text(Component):
             text (str): The new text to display.
         """
         self.text = text
-        self.font_object = self.font.render(self.text, True, self.font_color)
-        self.font_rect = self.font_object.get_rect(center=self.rect.center)
\ No newline at end of file
+        self.font_object = render_text(self.font, self.text, self.font_color)
+        self.font_rect = self.font_object.get_rect(center=self.rect.center)
+        self.mark_changed()
\ No newline at end of file
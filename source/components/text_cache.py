@@ -0,0 +1,113 @@
+"""
+This module contains the TextCache class, a process-wide cache of rendered text surfaces.
+"""
+
+from collections import OrderedDict
+import pygame as pyg
+from ..logger import get_logger
+from ..constants import DisplayConfig
+
+
+class TextCache:
+    """
+    A size-bounded LRU cache of rendered text surfaces.
+
+    Rendering text is the most expensive operation of the menus, so components
+    render their text through this cache instead of calling `font.render`.
+    The surfaces returned are shared and must not be modified.
+    """
+
+    def __init__(self, max_size: int = DisplayConfig.TEXT_CACHE_SIZE):
+        """
+        Create a new text cache.
+
+        Args:
+            max_size (int): The maximum number of surfaces kept in the cache.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.max_size: int = max_size
+        self.surfaces: OrderedDict[tuple, pyg.Surface] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def render(
+        self,
+        font: pyg.font.Font,
+        text: str,
+        color: tuple[int, int, int],
+        antialias: bool = True,
+    ) -> pyg.Surface:
+        """
+        Render a text, reusing the surface of a previous render if possible.
+
+        Args:
+            font (pyg.font.Font): The font to render the text with.
+            text (str): The text to render.
+            color (tuple[int, int, int]): The color of the text.
+            antialias (bool): Whether to render the text with antialiasing.
+
+        Returns:
+            pyg.Surface: The rendered text.
+        """
+        # the font itself is part of the key so its id can't be reused
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    @property
+    def stats(self) -> dict:
+        """
+        Get the statistics of the cache.
+
+        Returns:
+            dict: The size, hits, misses and evictions of the cache.
+        """
+        return {
+            "size": len(self.surfaces),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        """
+        Remove every surface from the cache.
+        """
+        self.surfaces.clear()
+        self.logger.info("Cleared.")
+
+
+text_cache = TextCache()
+
+
+def render_text(
+    font: pyg.font.Font,
+    text: str,
+    color: tuple[int, int, int],
+    antialias: bool = True,
+) -> pyg.Surface:
+    """
+    Render a text through the shared text cache.
+
+    Args:
+        font (pyg.font.Font): The font to render the text with.
+        text (str): The text to render.
+        color (tuple[int, int, int]): The color of the text.
+        antialias (bool): Whether to render the text with antialiasing.
+
+    Returns:
+        pyg.Surface: The rendered text.
+    """
+    return text_cache.render(font, text, color, antialias)
@@ -0,0 +1,201 @@
+"""
+This module contains the ConfigStore class, the settings of the player saved on the disk.
+"""
+
+import os
+import json
+import atexit
+import threading
+from time import monotonic
+from .logger import get_logger
+from .constants import GameConfig, ResourceConfig
+
+# the type and default value of every setting
+SCHEMA: dict[str, tuple[type, object]] = {
+    "lang": (str, GameConfig.DEFAULT_LANGUAGE),
+    "music_volume": (float, 1.0),
+}
+
+
+class ConfigStore:
+    """
+    The settings of the player, validated against a schema.
+
+    Changes are saved by a background thread: each change pushes back the
+    deadline of the next save, and once no change happens for a while the
+    settings are written to a temporary file that then replaces the
+    configurations file, so the file is never left half written. Nothing
+    is written if nothing changed.
+    """
+
+    # the wait after failed saves stops doubling after this many of them
+    MAX_BACKOFF: int = 6
+
+    def __init__(
+        self,
+        filename: str = ResourceConfig.CONFIG_FILE,
+        schema: dict[str, tuple[type, object]] = SCHEMA,
+        delay: float = ResourceConfig.CONFIG_SAVE_DELAY,
+    ):
+        """
+        Create a new store with the default values.
+
+        Args:
+            filename (str): The configurations file.
+            schema (dict[str, tuple[type, object]]): The type and default
+                value of each setting.
+            delay (float): The seconds without changes to wait before saving.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.filename: str = filename
+        self.schema: dict[str, tuple[type, object]] = schema
+        self.delay: float = delay
+        self.values: dict[str, object] = {
+            key: default for key, (_, default) in schema.items()
+        }
+        self.dirty: bool = False
+        self.deadline: float = 0.0
+        # consecutive failed saves, each one doubles the wait before the next
+        self.failures: int = 0
+        self.closed: bool = False
+        self.lock: threading.Lock = threading.Lock()
+        self.changed: threading.Condition = threading.Condition(self.lock)
+        self.write_lock: threading.Lock = threading.Lock()
+        self.writer: threading.Thread = None
+
+    def validate(self, key: str, value: object) -> object:
+        """
+        Convert a value to the type of a setting.
+
+        Args:
+            key (str): The setting.
+            value (object): The value.
+
+        Returns:
+            object: The converted value.
+
+        Raises:
+            KeyError: If the setting isn't in the schema.
+            ValueError: If the value can't be converted.
+        """
+        value_type, _ = self.schema[key]
+        if value_type is str and not isinstance(value, str):
+            raise ValueError(f"{key} must be a string, not {value!r}.")
+        try:
+            return value_type(value)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"{key} must be a {value_type.__name__}.") from exc
+
+    def load(self) -> None:
+        """
+        Load the settings from the configurations file. Missing or invalid
+        settings keep their default value, unknown ones are kept as they are.
+        """
+        if not os.path.exists(self.filename):
+            self.logger.warning("Configurations file not found.")
+            return
+        try:
+            with open(self.filename, "r", encoding="utf-8", errors="ignore") as file:
+                stored = json.load(file)
+        except (OSError, ValueError) as exc:
+            self.logger.error(f"Error reading {self.filename}: {exc}")
+            return
+        with self.lock:
+            for key, value in stored.items():
+                if key not in self.schema:
+                    self.values[key] = value
+                    continue
+                try:
+                    self.values[key] = self.validate(key, value)
+                except ValueError as exc:
+                    self.logger.warning(f"Using the default {key}: {exc}")
+        self.logger.info("Configurations loaded.")
+
+    def get(self, key: str) -> object:
+        """
+        Get the value of a setting.
+        """
+        return self.values[key]
+
+    def set(self, key: str, value: object) -> None:
+        """
+        Change a setting and schedule saving the settings.
+
+        Args:
+            key (str): The setting.
+            value (object): The new value.
+
+        Raises:
+            KeyError: If the setting isn't in the schema.
+            ValueError: If the value doesn't match the type of the setting.
+        """
+        value = self.validate(key, value)
+        with self.changed:
+            if self.values.get(key) == value:
+                return
+            self.values[key] = value
+            self.dirty = True
+            self.deadline = monotonic() + self.delay
+            if self.writer is None:
+                self.writer = threading.Thread(
+                    target=self.run, name="config", daemon=True
+                )
+                self.writer.start()
+                # the writer is a daemon, the last change is saved on exit
+                atexit.register(self.close)
+            self.changed.notify()
+
+    def run(self) -> None:
+        """
+        Save the settings once they stop changing, until the store is closed.
+        Runs on the writer thread.
+        """
+        while True:
+            with self.changed:
+                while not self.closed and (
+                    not self.dirty or monotonic() < self.deadline
+                ):
+                    timeout = self.deadline - monotonic() if self.dirty else None
+                    self.changed.wait(timeout)
+                if self.closed:
+                    return
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the settings to the configurations file if they changed.
+        """
+        with self.write_lock:
+            with self.lock:
+                if not self.dirty:
+                    return
+                values = dict(self.values)
+                self.dirty = False
+            temporary = f"{self.filename}.tmp"
+            try:
+                with open(temporary, "w", encoding="utf-8") as file:
+                    json.dump(values, file, indent=4)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temporary, self.filename)
+            except OSError as exc:
+                with self.lock:
+                    self.dirty = True
+                    self.failures += 1
+                    # retried later instead of right away, close() still tries
+                    backoff = self.delay * 2 ** min(self.failures, self.MAX_BACKOFF)
+                    self.deadline = monotonic() + backoff
+                self.logger.error(f"Error saving {self.filename}: {exc}")
+                return
+            with self.lock:
+                self.failures = 0
+        self.logger.info("Configurations saved.")
+
+    def close(self) -> None:
+        """
+        Stop the writer thread and save right away, if anything changed.
+        """
+        with self.changed:
+            self.closed = True
+            self.changed.notify()
+        self.flush()
@@ -12,3 +12,5 @@ class DisplayConfig:
     HEIGHT: int = 600
     FULLSCREEN: bool = False
     SIZE: tuple[int, int] = WIDTH, HEIGHT
+    TEXT_CACHE_SIZE: int = 256
+    GRID_CELL_SIZE: int = 100
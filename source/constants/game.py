@@ -12,6 +12,16 @@ class GameConfig:
     TITLE: str = "UniverseCatch"
     VERSION: str = "0.1.0"
     FPS: int = 60
+    DIRTY_RENDERING: bool = False
+    IDLE_MODE: bool = True
+    IDLE_TIMEOUT: int = 1000  # ms
+    FRAME_TIMING_SAMPLES: int = 600
+    FRAME_TIMING_FILE: str = "frame_timings.json"
+    # keep the last LOG_BUFFER_SIZE log records in memory, debug ones only
+    # there, and write them to LOG_BUFFER_FILE on errors, on stop and on F4
+    STRUCTURED_LOGGING: bool = False
+    LOG_BUFFER_SIZE: int = 4096
+    LOG_BUFFER_FILE: str = "app_log.jsonl"
     INITIAL_SCENE_ID: str = "intro"
 
     DEFAULT_LANGUAGE: str = "en"
@@ -9,11 +9,50 @@ class ResourceConfig:
     """
 
     CONFIG_FILE: str = "config.json"
+    # seconds without changes before the configurations are saved
+    CONFIG_SAVE_DELAY: float = 1.0
     RESOURCE_DIR: str = "resources"
+    # built with `python tools/pack_assets.py resources resources.bundle`,
+    # the loose files in RESOURCE_DIR are used when it doesn't exist
+    BUNDLE_FILE: str = "resources.bundle"
     LOCALIZATIONS_DIR: str = RESOURCE_DIR + "/localizations"
     PLANETS_DIR: str = RESOURCE_DIR + "/planets"
     SOUNDS_DIR: str = RESOURCE_DIR + "/sounds"
     MUSIC_DIR: str = RESOURCE_DIR + "/music"
+    FONTS_DIR: str = RESOURCE_DIR + "/fonts"
+
+    # threads used to read and decode the images in the background
+    LOADER_WORKERS: int = 4
+
+    # load images on first access instead of at startup, keeping at most
+    # IMAGE_MEMORY_BUDGET bytes of them in memory
+    LAZY_LOADING: bool = False
+    IMAGE_MEMORY_BUDGET: int = 64 * 1024 * 1024
+
+    # keep the decoded (and scaled) pixels of the images on the disk, so
+    # later starts skip decoding them; entries are replaced when a source changes
+    PIXEL_CACHE: bool = True
+    PIXEL_CACHE_DIR: str = ".cache/pixels"
+    # the localization files compiled to flat tables, reused until a file changes
+    LOCALIZATION_CACHE_DIR: str = ".cache/localizations"
+
+    # the images are decoded and scaled to the size the scenes draw them at,
+    # in the background, so the full size copies are never kept
+    IMAGE_SIZES: dict[str, tuple[int, int]] = {
+        "screen_loading": (1000, 600),
+        "logo": (400, 200),
+    }
+
+    # the card images are packed into pages of at most ATLAS_PAGE_SIZE pixels,
+    # at their own size and at each of CARD_SIZES
+    ATLAS_PAGE_SIZE: tuple[int, int] = (1024, 1024)
+    CARD_SIZES: list[tuple[int, int]] = [(76, 113)]
+
+    # (face, size) pairs loaded at startup, a None face is the default font
+    FONTS: list[tuple[str, int]] = [
+        (None, 24),
+        (None, 36),
+    ]
 
     PLANETS: dict = {
         0: "mercury.png",
@@ -28,6 +67,20 @@ class ResourceConfig:
         9: "bellerophonn.png",
     }
 
+    # fade the music in and out over MUSIC_FADE_MS, 0 to play the tracks
+    # back to back without fades; the volume changes every MUSIC_FADE_STEP_MS
+    MUSIC_FADE_MS: int = 0
+    MUSIC_FADE_STEP_MS: int = 50
+
+    # the sound effects are played on SOUND_CHANNELS reserved mixer channels;
+    # when all are busy an effect takes the channel of a lower (or equal)
+    # priority one, or is dropped
+    SOUND_CHANNELS: int = 8
+
+    # name: (file in SOUNDS_DIR, priority), decoded at startup, or on first
+    # play when LAZY_LOADING is on
+    SOUNDS: dict[str, tuple[str, int]] = {}
+
     MUSICS: dict = {
         "Calm Cosmos": "calm_cosmos.mp3",
         "Deep Space": "deep_space.mp3",
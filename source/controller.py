@@ -4,32 +4,45 @@ This class is responsible for managing the game.
 """
 
 import os
-import json
 import pygame as pyg
 from .scene import Scene
-from .logger import get_logger
+from .logger import get_logger, enable_ring_buffer, get_ring_buffer
 from .constants import DisplayConfig, Colors, GameConfig, ResourceConfig
 from .resource_loader import ResourceLoader
 from .localizations import Localizations
 from .music import Music
+from .config_store import ConfigStore
+from .frame_timer import FrameTimer
+from .startup_profiler import StartupProfiler
+from .components.frame_timing_overlay import FrameTimingOverlay
 
 
 class Controller:
-    def __init__(self):
+    def __init__(self, startup_profiler: StartupProfiler = None):
         """
         Initialize the controller.
 
         The controller is responsible for managing the game.
         After starting, the method `set` must be called to set the configurations.
+
+        Args:
+            startup_profiler (StartupProfiler): The profiler the startup steps
+                are recorded in, by default a new disabled one.
         """
+        if GameConfig.STRUCTURED_LOGGING:
+            enable_ring_buffer(GameConfig.LOG_BUFFER_SIZE, GameConfig.LOG_BUFFER_FILE)
         self.logger = get_logger(self.__class__.__name__)
+        self.startup_profiler: StartupProfiler = startup_profiler or StartupProfiler()
         self.lang: str = GameConfig.DEFAULT_LANGUAGE
         self.scenes: dict[str, Scene] = {}
+        self.scene_factories: dict[str, callable] = {}
         self.scene_id: str = GameConfig.INITIAL_SCENE_ID
         self.screen: pyg.Surface = None
         self.clock: pyg.time.Clock = None
         self.running: bool = True
         self.debug: bool = GameConfig.DEBUG
+        self.dirty_rendering: bool = GameConfig.DIRTY_RENDERING
+        self.idle_mode: bool = GameConfig.IDLE_MODE
         self.resource_loader: ResourceLoader = ResourceLoader(
             resource_dir=ResourceConfig.RESOURCE_DIR
         )
@@ -37,6 +50,12 @@ class Controller:
             localizations_dir=ResourceConfig.LOCALIZATIONS_DIR
         )
         self.music: Music = Music(music_path=ResourceConfig.MUSIC_DIR)
+        self.frame_timer: FrameTimer = FrameTimer()
+        self.config: ConfigStore = ConfigStore(ResourceConfig.CONFIG_FILE)
+        self.frame_timing_overlay: FrameTimingOverlay = FrameTimingOverlay()
+        self.event_handlers: dict[int, list[callable]] = {}
+        # the event types SDL lets into the queue, None until the filter is set
+        self.allowed_event_types: set[int] = None
         self.logger.info("Initialized.")
 
     @property
@@ -47,55 +66,56 @@ class Controller:
         Returns:
             Scene: The current scene.
         """
-        try:
-            return self.scenes[self.scene_id]
-        except KeyError:
+        scene = self.scenes.get(self.scene_id)
+        if scene is not None:
+            return scene
+        if self.scene_id not in self.scene_factories:
             raise KeyError(f"Scene {self.scene_id} not found.")
+        return self.create_scene(self.scene_id)
 
     def set(self) -> None:
         """
         Set all necessary configurations for the controller.
         """
-        pyg.init()
-        pyg.display.set_caption(GameConfig.TITLE)
-        os.environ["SDL_VIDEO_CENTERED"] = "1"
-        self.screen = pyg.display.set_mode(DisplayConfig.SIZE)
-        self.clock = pyg.time.Clock()
-        self.screen.fill(Colors.BLACK)
-        self.music.init_music()
-        self.localizations.load_all_localizations()
-        self.resource_loader.load_all_images()
-        self.load_config()
+        step = self.startup_profiler.step
+        with step("set", "pygame"):
+            pyg.init()
+        with step("set", "display"):
+            pyg.display.set_caption(GameConfig.TITLE)
+            os.environ["SDL_VIDEO_CENTERED"] = "1"
+            self.screen = pyg.display.set_mode(DisplayConfig.SIZE)
+            self.clock = pyg.time.Clock()
+            self.screen.fill(Colors.BLACK)
+        with step("set", "fonts"):
+            self.resource_loader.load_all_fonts()
+        with step("set", "music"):
+            self.music.init_music(font=self.resource_loader.get_font(size=36))
+        with step("set", "sounds"):
+            self.resource_loader.load_all_sounds()
+        with step("set", "frame timing overlay"):
+            self.frame_timing_overlay.init(font=self.resource_loader.get_font(size=24))
+        with step("set", "images"):
+            self.resource_loader.start_loading_images()
+        with step("set", "config"):
+            self.load_config()
+        # the rest of the languages are prefetched after the first frame
+        with step("set", "localizations"):
+            self.localizations.load_localization(self.lang)
+        self.subscribe(pyg.QUIT, self.on_quit)
+        self.subscribe(pyg.VIDEOEXPOSE, lambda event: self.current_scene.invalidate())
+        for event_type in Music.EVENT_TYPES:
+            self.subscribe(event_type, self.music.handle_event)
+        if self.debug:
+            self.subscribe(pyg.KEYDOWN, self.on_debug_key)
         self.logger.info("Configurations set.")
 
     def load_config(self) -> None:
         """
-        Load the configurations of the controller.
+        Load the configurations of the controller, and apply them.
         """
-        if not os.path.exists(ResourceConfig.CONFIG_FILE):
-            self.logger.warning("Configurations file not found.")
-            return
-        with open(
-            ResourceConfig.CONFIG_FILE, "r", encoding="utf-8", errors="ignore"
-        ) as file:
-            actual_config = json.load(file)
-            self.set_language(actual_config["lang"])
-            self.music.set_volume(float(actual_config["music_volume"]))
-        self.logger.info("Configurations loaded.")
-
-    def save_config(self) -> None:
-        """
-        Save the configurations of the controller.
-        """
-        with open(
-            ResourceConfig.CONFIG_FILE, "w", encoding="utf-8", errors="ignore"
-        ) as file:
-            actual_config = {
-                "lang": self.lang,
-                "music_volume": self.music.get_volume,
-            }
-            json.dump(actual_config, file, indent=4)
-        self.logger.info("Configurations saved.")
+        self.config.load()
+        self.set_language(self.config.get("lang"))
+        self.music.set_volume(self.config.get("music_volume"))
 
     # TODO: maybe move to localizations.py
     def set_language(self, lang: str) -> None:
@@ -110,21 +130,59 @@ class Controller:
             self.logger.error(msg)
             return
         self.lang = lang
+        self.config.set("lang", lang)
+        # never parsed here: until it is loaded, the default language is shown
+        self.localizations.request(lang)
+        if self.scene_id in self.scenes:
+            self.current_scene.invalidate_layer()
         self.logger.info(f"Language set to {lang}.")
 
-    def populate(self, scenes: list[Scene] = []) -> None:
+    def set_music_volume(self, volume: float) -> None:
+        """
+        Set the volume of the music, and save it in the configurations.
+
+        Args:
+            volume (float): The volume, from 0 to 1.
+        """
+        volume = min(1.0, max(0.0, volume))
+        self.music.set_volume(volume)
+        self.config.set("music_volume", volume)
+
+    def on_languages_loaded(self, languages: list[str]) -> None:
+        """
+        Refresh the texts of the scenes once the current language finishes
+        loading in the background, since they show the default language until then.
+
+        Args:
+            languages (list[str]): The languages that finished loading.
+        """
+        if self.lang not in languages:
+            return
+        for scene in self.scenes.values():
+            # refreshed when they are next prepared
+            scene.lang = None
+        if self.current_scene.built:
+            self.current_scene.refresh_texts()
+
+    def populate(
+        self, scenes: list[Scene] = [], factories: dict[str, callable] = None
+    ) -> None:
         """
         Populate the controller with the scenes.
 
         Args:
             scenes (list[Scene]): The scenes to be added to the controller.
+            factories (dict[str, callable]): The function that creates each
+                scene, by id, called with the controller the first time the
+                scene is needed. Eg. {"main_menu": MainMenuScene}.
         """
-        if len(scenes) == 0:
+        if len(scenes) == 0 and not factories:
             msg = "No scenes to populate."
             self.logger.error(msg)
             raise ValueError(msg)
         for scene in scenes:
             self.add_scene(scene)
+        self.scene_factories.update(factories or {})
         if self.debug:
             self.logger.debug("Scenes populated.")
 
@@ -139,6 +197,28 @@ class Controller:
         if self.debug:
             self.logger.debug(f"Scene added: {scene.name}")
 
+    def create_scene(self, scene_id: str) -> Scene:
+        """
+        Create a scene with its factory and add it to the controller.
+
+        Args:
+            scene_id (str): The id of the scene.
+
+        Returns:
+            Scene: The scene created.
+        """
+        factory = self.scene_factories[scene_id]
+        with self.startup_profiler.step("scene", scene_id):
+            scene = factory(self)
+        if scene.name != scene_id:
+            msg = f"The factory of {scene_id} created the scene {scene.name}."
+            self.logger.error(msg)
+            raise ValueError(msg)
+        # kept until the scene is created, so a failed attempt can be retried
+        del self.scene_factories[scene_id]
+        self.add_scene(scene)
+        return scene
+
     def change_scene(self, scene_id: str) -> None:
         """
         Change the current scene.
@@ -148,32 +228,246 @@ class Controller:
         """
         last_scene = self.scene_id
         self.current_scene.on_exit()
+        self.unsubscribe_scene(self.current_scene)
         self.scene_id = scene_id
+        self.current_scene.prepare()
         self.current_scene.on_enter()
+        self.current_scene.invalidate()
+        self.subscribe_scene(self.current_scene)
+        # once, so the types both scenes handle are never blocked in between
+        self.update_event_filter()
         if self.debug:
             self.logger.debug(f"Scene changed: {last_scene} -> {scene_id}")
 
-    def event_handler(self) -> None:
+    def event_handler(self, events: list[pyg.event.Event] = None) -> None:
         """
         Handle the events of the game.
+
+        Args:
+            events (list[pyg.event.Event]): The events to handle, by default
+                the events in the queue.
+        """
+        if events is None:
+            events = pyg.event.get()
+        for event in self.coalesce_events(events):
+            # copied, a handler can change the scene and so the subscriptions
+            for handler in tuple(self.event_handlers.get(event.type, ())):
+                handler(event)
+
+    @staticmethod
+    def coalesce_events(events: list[pyg.event.Event]) -> list[pyg.event.Event]:
         """
-        for event in pyg.event.get():
-            if event.type == pyg.QUIT:
-                self.running = False
-            if self.debug:
-                pass
-            self.current_scene.handle_event(event)
-            self.music.handle_event(event)
+        Merge each run of consecutive mouse motion events into a single event
+        with the latest position, so a burst costs a single dispatch.
 
-    def update(self, delta_time: float) -> None:
+        Args:
+            events (list[pyg.event.Event]): The events to coalesce.
+
+        Returns:
+            list[pyg.event.Event]: The coalesced events, in order.
+        """
+        coalesced = []
+        for event in events:
+            last = coalesced[-1] if coalesced else None
+            if event.type == pyg.MOUSEMOTION and last and last.type == pyg.MOUSEMOTION:
+                rel = (last.rel[0] + event.rel[0], last.rel[1] + event.rel[1])
+                coalesced[-1] = pyg.event.Event(pyg.MOUSEMOTION, event.dict, rel=rel)
+            else:
+                coalesced.append(event)
+        return coalesced
+
+    def subscribe(
+        self, event_type: int, handler: callable, update_filter: bool = True
+    ) -> None:
+        """
+        Call a handler for every event of a type.
+
+        Args:
+            event_type (int): The type of the events. Eg. pyg.QUIT.
+            handler (callable): The function to call with each event.
+            update_filter (bool): Whether to update the event filter right
+                away, False when the caller updates it after a batch of changes.
+        """
+        handlers = self.event_handlers.setdefault(event_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+            if update_filter:
+                self.update_event_filter()
+
+    def unsubscribe(
+        self, event_type: int, handler: callable, update_filter: bool = True
+    ) -> None:
+        """
+        Stop calling a handler for the events of a type.
+
+        Args:
+            event_type (int): The type of the events.
+            handler (callable): The function subscribed.
+            update_filter (bool): Whether to update the event filter right
+                away, False when the caller updates it after a batch of changes.
+        """
+        handlers = self.event_handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self.event_handlers[event_type]
+            if update_filter:
+                self.update_event_filter()
+
+    def subscribe_scene(self, scene: Scene) -> None:
+        """
+        Send to a scene the events its components handle.
+        The event filter must be updated afterwards.
+
+        Args:
+            scene (Scene): The scene to subscribe.
+        """
+        for event_type in scene.event_types:
+            self.subscribe(event_type, scene.handle_event, update_filter=False)
+
+    def unsubscribe_scene(self, scene: Scene) -> None:
+        """
+        Stop sending events to a scene.
+        The event filter must be updated afterwards.
+
+        Args:
+            scene (Scene): The scene to unsubscribe.
+        """
+        for event_type in list(self.event_handlers):
+            self.unsubscribe(event_type, scene.handle_event, update_filter=False)
+
+    def update_event_filter(self) -> None:
+        """
+        Only let the event types with subscribers into the event queue,
+        the other ones are dropped by SDL.
+
+        SDL also removes the queued events of a type when it is blocked, so
+        only the types that gained their first subscriber or lost their last
+        one are changed, and the rest of the queue is kept.
+        """
+        if not pyg.display.get_init():
+            return
+        wanted = set(self.event_handlers)
+        if self.allowed_event_types is None:
+            pyg.event.set_blocked(None)
+            pyg.event.set_allowed(list(wanted))
+        else:
+            added = wanted - self.allowed_event_types
+            removed = self.allowed_event_types - wanted
+            if added:
+                pyg.event.set_allowed(list(added))
+            if removed:
+                pyg.event.set_blocked(list(removed))
+        self.allowed_event_types = wanted
+
+    def on_quit(self, event: pyg.event.Event) -> None:
+        """
+        Stop the main loop when the window is closed.
+        """
+        self.running = False
+
+    def on_debug_key(self, event: pyg.event.Event) -> None:
+        """
+        Handle the keys of the debug tools.
+        """
+        if event.key == pyg.K_F3:
+            self.toggle_frame_timings()
+        elif event.key == pyg.K_F4:
+            self.flush_logs()
+
+    def flush_logs(self) -> None:
+        """
+        Write the log records kept in memory in structured mode to their file.
+        """
+        ring_buffer = get_ring_buffer()
+        if ring_buffer is None:
+            return
+        count = ring_buffer.flush()
+        self.logger.info(f"{count} log records saved ({ring_buffer.filename}).")
+
+    @property
+    def is_idle(self) -> bool:
+        """
+        Check if nothing on the screen can change without input, meaning
+        the current scene has nothing to draw, no notification is shown and
+        no resources are loading.
+
+        Returns:
+            bool: True if the game is idle, False otherwise.
+        """
+        scene_busy = self.current_scene.needs_redraw()
+        overlays_busy = (
+            self.music.notification.visible or self.frame_timing_overlay.visible
+        )
+        loading = self.resource_loader.loading or self.localizations.loading
+        return not scene_busy and not overlays_busy and not loading
+
+    def wait_events(self) -> list[pyg.event.Event] | None:
+        """
+        Block until an event arrives or the idle timeout expires.
+
+        Returns:
+            list[pyg.event.Event] | None: The events received, or None if
+                the timeout expired.
+        """
+        event = pyg.event.wait(GameConfig.IDLE_TIMEOUT)
+        if event.type == pyg.NOEVENT:
+            return None
+        return [event, *pyg.event.get()]
+
+    def update(self, delta_time: float) -> list[pyg.Rect] | None:
         """
         Update the game.
 
         Args:
             delta_time (float): The time since the last update.
+
+        Returns:
+            list[pyg.Rect] | None: The areas of the screen that changed,
+                or None if the whole screen must be updated.
+        """
+        if self.resource_loader.loading:
+            self.resource_loader.poll()
+        if self.localizations.loading:
+            self.on_languages_loaded(self.localizations.poll())
+        notification = self.music.notification
+        overlay = self.frame_timing_overlay
+        # the scene must repaint what is under the notification and the overlay
+        if notification.visible:
+            self.current_scene.mark_dirty(notification.area)
+        if overlay.visible and overlay.rect:
+            self.current_scene.mark_dirty(overlay.rect)
+        dirty_rects = self.current_scene.update(self.screen, delta_time)
+        self.frame_timer.lap("scene")
+        notification_rect = notification.update(self.screen)
+        self.frame_timer.lap("notification")
+        overlay_rect = overlay.update(self.screen, self.frame_timer, self.scene_id)
+        self.frame_timer.lap("overlay")
+        if dirty_rects is not None:
+            dirty_rects.extend(
+                rect for rect in (notification_rect, overlay_rect) if rect
+            )
+        return dirty_rects
+
+    def toggle_frame_timings(self) -> None:
+        """
+        Toggle the on-screen overlay with the frame timings of the current scene.
         """
-        self.current_scene.update(self.screen, delta_time)
-        self.music.notification.update(self.screen)
+        self.frame_timing_overlay.toggle()
+        self.current_scene.invalidate()
+
+    def refresh_display(self, dirty_rects: list[pyg.Rect] | None) -> None:
+        """
+        Push the changes of the current frame to the display.
+
+        Args:
+            dirty_rects (list[pyg.Rect] | None): The areas of the screen that
+                changed, or None to update the whole screen.
+        """
+        if self.dirty_rendering and dirty_rects is not None:
+            pyg.display.update(dirty_rects)
+        else:
+            pyg.display.update()
 
     def start(self) -> None:
         """
@@ -182,26 +476,60 @@ class Controller:
         if not self.screen:
             raise RuntimeError("The controller must be set before starting.")
         try:
-            self.current_scene.on_enter()
-            self.music.play_music()
+            with self.startup_profiler.step("start", "first scene"):
+                self.current_scene.prepare()
+                self.current_scene.on_enter()
+                self.current_scene.invalidate()
+                self.subscribe_scene(self.current_scene)
+                self.update_event_filter()
+            with self.startup_profiler.step("start", "music"):
+                self.music.play_music()
             while self.running:
+                events = None
+                if self.idle_mode and self.is_idle:
+                    events = self.wait_events()
+                    if events is None:
+                        continue
                 time_delta = self.clock.tick(GameConfig.FPS) / 1000.0
-                self.event_handler()
-                self.update(time_delta)
-                pyg.display.update()
+                self.frame_timer.begin(self.scene_id)
+                self.event_handler(events)
+                self.frame_timer.lap("events")
+                dirty_rects = self.update(time_delta)
+                self.refresh_display(dirty_rects)
+                self.frame_timer.lap("display")
+                self.frame_timer.end()
+                if self.startup_profiler.first_frame is None:
+                    self.on_first_frame()
         except Exception as exc:
             self.logger.error(f"An error occurred: {exc}")
             self.stop()
         finally:
+            self.shutdown()
             pyg.quit()
             exit()
 
+    def on_first_frame(self) -> None:
+        """
+        Finish the startup once the first frame is shown: record it, and
+        start loading the languages that aren't needed yet in the background.
+        """
+        self.startup_profiler.finish()
+        self.localizations.prefetch(self.localizations.available_languages())
+
     def stop(self) -> None:
         """
-        Stop the controller.
+        Stop the controller, the main loop ends after the current frame.
         """
         self.running = False
         self.logger.info("Stopped by user.")
-        self.save_config()
-        pyg.quit()
-        exit()
+
+    def shutdown(self) -> None:
+        """
+        Save the settings not saved yet, the frame timings in debug mode and
+        the log records kept in memory. Called when the main loop ends,
+        however it ends.
+        """
+        self.config.close()
+        if self.debug:
+            self.frame_timer.dump()
+        self.flush_logs()
@@ -0,0 +1,161 @@
+"""
+This module is responsible for measuring where the time of each frame goes.
+"""
+
+import json
+import math
+from collections import deque
+from time import perf_counter
+from .logger import get_logger
+from .constants import GameConfig
+
+
+class FrameTimer:
+    """
+    This class records the duration of each phase of a frame, per scene,
+    in fixed-size ring buffers.
+
+    Eg.
+        timer.begin("main_menu")
+        ...handle events...
+        timer.lap("events")
+        ...draw the scene...
+        timer.lap("scene")
+        timer.end()
+    """
+
+    PHASES: tuple[str, ...] = (
+        "events",
+        "scene",
+        "notification",
+        "overlay",
+        "display",
+        "frame",
+    )
+
+    def __init__(self, size: int = GameConfig.FRAME_TIMING_SAMPLES):
+        """
+        Initialize the frame timer.
+
+        Args:
+            size (int): The number of samples kept for each scene and phase.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.size: int = size
+        self.samples: dict[str, dict[str, deque[float]]] = {}
+        self.scene_id: str = None
+        self.frame_start: float = None
+        self.last_lap: float = None
+
+    def begin(self, scene_id: str) -> None:
+        """
+        Start measuring a frame.
+
+        Args:
+            scene_id (str): The scene the frame belongs to.
+        """
+        self.scene_id = scene_id
+        self.frame_start = self.last_lap = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """
+        Record the time since the last lap (or the start of the frame) as
+        the duration of the given phase. Ignored outside of a frame.
+
+        Args:
+            phase (str): The phase that just finished.
+        """
+        if self.last_lap is None:
+            return
+        now = perf_counter()
+        self.record(self.scene_id, phase, now - self.last_lap)
+        self.last_lap = now
+
+    def end(self) -> None:
+        """
+        Finish measuring a frame, recording its total duration.
+        """
+        if self.frame_start is None:
+            return
+        self.record(self.scene_id, "frame", perf_counter() - self.frame_start)
+        self.frame_start = self.last_lap = None
+
+    def record(self, scene_id: str, phase: str, duration: float) -> None:
+        """
+        Record a duration.
+
+        Args:
+            scene_id (str): The scene the duration belongs to.
+            phase (str): The phase that was measured.
+            duration (float): The duration in seconds.
+        """
+        phases = self.samples.get(scene_id)
+        if phases is None:
+            phases = self.samples[scene_id] = {
+                name: deque(maxlen=self.size) for name in self.PHASES
+            }
+        if phase not in phases:
+            phases[phase] = deque(maxlen=self.size)
+        phases[phase].append(duration)
+
+    @staticmethod
+    def percentile(values: list[float], percent: float) -> float:
+        """
+        Get a percentile of sorted values using the nearest-rank method.
+
+        Args:
+            values (list[float]): The values, sorted.
+            percent (float): The percentile to get, from 0 to 100.
+
+        Returns:
+            float: The percentile, or 0 if there are no values.
+        """
+        if not values:
+            return 0.0
+        rank = math.ceil(percent / 100 * len(values))
+        return values[max(0, min(len(values), rank) - 1)]
+
+    def summary(self, scene_id: str = None) -> dict:
+        """
+        Get the statistics of the recorded durations, in milliseconds.
+
+        Args:
+            scene_id (str): The scene to summarize, by default all of them.
+
+        Returns:
+            dict: The count, mean, p50, p95 and p99 of each phase, by scene.
+        """
+        scene_ids = [scene_id] if scene_id else list(self.samples)
+        result = {}
+        for current in scene_ids:
+            phases = {}
+            for phase, samples in self.samples.get(current, {}).items():
+                if not samples:
+                    continue
+                values = sorted(samples)
+                phases[phase] = {
+                    "count": len(values),
+                    "mean": sum(values) / len(values) * 1000,
+                    "p50": self.percentile(values, 50) * 1000,
+                    "p95": self.percentile(values, 95) * 1000,
+                    "p99": self.percentile(values, 99) * 1000,
+                }
+            result[current] = phases
+        return result
+
+    def dump(self, filename: str = GameConfig.FRAME_TIMING_FILE) -> None:
+        """
+        Write the summary of the recorded durations to a JSON file.
+
+        Args:
+            filename (str): The file to write.
+        """
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=4)
+        self.logger.info(f"Frame timings saved ({filename}).")
+
+    def clear(self) -> None:
+        """
+        Remove every recorded duration.
+        """
+        self.samples.clear()
@@ -1,54 +1,274 @@
 import os
+import sys
 import json
+import marshal
+from concurrent.futures import Future, ThreadPoolExecutor
 from .logger import UCLogger, get_logger
+from .constants import GameConfig, ResourceConfig
 
 
 class Localizations:
     """
     This class is responsible for loading localization resources from the disk.
+
+    Each language is compiled into a flat table of dotted keys
+    ("menu.play"), merged over the tables of its fallback languages, so a
+    text is found with a single lookup.
+
+    Languages are loaded on demand: right away with `load_localization`, or
+    in a background thread with `request`/`prefetch`, the tables being
+    installed on the main thread by `poll`. Until a language is loaded its
+    texts are looked up in the default language.
     """
 
-    def __init__(self, localizations_dir: str = "localizations"):
+    CACHE_VERSION: int = 1
+
+    def __init__(
+        self,
+        localizations_dir: str = "localizations",
+        cache_dir: str = ResourceConfig.LOCALIZATION_CACHE_DIR,
+    ):
+        """
+        Args:
+            localizations_dir (str): The directory of the localization files.
+            cache_dir (str): The directory where the compiled tables are
+                cached, None to always compile them.
+        """
         self.logger: UCLogger = get_logger(self.__class__.__name__)
         self.dir: str = localizations_dir
         if not os.path.isdir(localizations_dir):
             msg = f"Directory '{localizations_dir}' not found."
             self.logger.error(msg)
             raise FileNotFoundError(msg)
+        self.cache_dir: str = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
         self.logger.info("Initialized.")
-        self.data: dict = {}
+        # the compiled table of each language, and the same merged over its fallbacks
+        self.tables: dict[str, dict[str, str]] = {}
+        self.lookups: dict[str, dict[str, str]] = {}
+        self.missing: set[tuple[str, str]] = set()
+        self.executor: ThreadPoolExecutor = None
+        self.pending: dict[str, Future] = {}
+
+    @staticmethod
+    def fallback_chain(language_code: str) -> tuple[str, ...]:
+        """
+        Get the languages a text is looked up in, in order.
+        Eg: fallback_chain("es") -> ("es", "en")
+        """
+        if language_code == GameConfig.DEFAULT_LANGUAGE:
+            return (language_code,)
+        return (language_code, GameConfig.DEFAULT_LANGUAGE)
+
+    @staticmethod
+    def compile(data: dict, prefix: str = "") -> dict[str, str]:
+        """
+        Flatten the nested sections of a localization file into dotted keys.
+        Eg: compile({"menu": {"play": "Play"}}) -> {"menu.play": "Play"}
+        """
+        table = {}
+        for key, value in data.items():
+            key = f"{prefix}{key}"
+            if isinstance(value, dict):
+                table.update(Localizations.compile(value, f"{key}."))
+            else:
+                table[sys.intern(key)] = value
+        return table
+
+    def available_languages(self) -> list[str]:
+        """
+        Get the codes of the languages with a localization file.
+        """
+        return sorted(
+            file.split(".")[0]
+            for file in os.listdir(self.dir)
+            if file.endswith(".json")
+        )
 
     def load_all_localizations(self) -> None:
         """
         Load all localization files from the disk.
         """
-        for file in os.listdir(self.dir):
-            if file.endswith(".json"):
-                language_code = file.split(".")[0]
-                self.load_localization(language_code)
+        for language_code in self.available_languages():
+            self.load_localization(language_code)
+
+    def is_loaded(self, language_code: str) -> bool:
+        return language_code in self.tables
+
+    def load_localization(self, language_code: str) -> dict[str, str]:
+        """
+        Load a specific localization file and its fallback languages, blocking
+        until they are loaded. A language being loaded in the background is
+        waited for instead of being loaded twice.
+
+        Returns:
+            dict[str, str]: The table of the language merged over its fallbacks.
+        """
+        for fallback in reversed(self.fallback_chain(language_code)[1:]):
+            if not self.is_loaded(fallback):
+                self.load_localization(fallback)
+        if self.is_loaded(language_code):
+            return self.lookups[language_code]
+        future = self.pending.pop(language_code, None)
+        table = future.result() if future else self.read_table(language_code)
+        if table is None:
+            return {}
+        return self.install(language_code, table)
 
-    def load_localization(self, language_code: str) -> dict:
+    def read_table(self, language_code: str) -> dict[str, str] | None:
         """
-        Load a specific localization file.
+        Read the compiled table of a language, from the cache if it is up to
+        date or else from its localization file. Safe to call from any thread.
+
+        Returns:
+            dict[str, str] | None: The table, None if there is no file.
         """
         localization_file = os.path.join(self.dir, f"{language_code}.json")
         if not os.path.isfile(localization_file):
             self.logger.error(f"Localization file not found: {localization_file}")
-            return {}
+            return None
 
-        with open(localization_file, "r", encoding="utf-8", errors="ignore") as file:
-            self.data[language_code] = json.load(file)
+        source = os.stat(localization_file)
+        signature = [self.CACHE_VERSION, source.st_mtime_ns, source.st_size]
+        table = self.read_cache(language_code, signature)
+        if table is None:
+            with open(
+                localization_file, "r", encoding="utf-8", errors="ignore"
+            ) as file:
+                table = self.compile(json.load(file))
+            self.write_cache(language_code, signature, table)
+        return table
 
+    def install(self, language_code: str, table: dict[str, str]) -> dict[str, str]:
+        """
+        Store the table of a language, merged over its fallbacks.
+        Must be called on the main thread.
+        """
+        self.tables[language_code] = table
+        lookup = {}
+        for fallback in reversed(self.fallback_chain(language_code)):
+            lookup.update(self.tables.get(fallback, {}))
+        self.lookups[language_code] = lookup
         self.logger.info(f"Loaded successfully: {language_code}")
-        return self.data[language_code]
+        return lookup
 
-    def get_key(self, key: str, language_code: str) -> str:
+    def request(self, language_code: str) -> None:
         """
-        Get a specific key from the localization data.
-        Eg: get_key("planets", "es")
+        Start loading a language in the background, if it isn't loaded or
+        loading already. Its fallback languages must be loaded.
         """
+        if self.is_loaded(language_code) or language_code in self.pending:
+            return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="localizations"
+            )
+        self.pending[language_code] = self.executor.submit(
+            self.read_table, language_code
+        )
+
+    def prefetch(self, language_codes: list[str]) -> None:
+        """
+        Start loading languages in the background, one after the other.
+        """
+        for language_code in language_codes:
+            self.request(language_code)
+
+    @property
+    def loading(self) -> bool:
+        """
+        Check if languages are still loading in the background.
+        """
+        return bool(self.pending)
+
+    def poll(self) -> list[str]:
+        """
+        Install the languages that finished loading in the background.
+        Must be called on the main thread.
+
+        Returns:
+            list[str]: The codes of the languages installed.
+        """
+        finished = [code for code, future in self.pending.items() if future.done()]
+        installed = []
+        for language_code in finished:
+            future = self.pending.pop(language_code)
+            try:
+                table = future.result()
+            except Exception as exc:
+                self.logger.error(f"Error loading {language_code}: {exc}")
+                continue
+            if table is not None:
+                self.install(language_code, table)
+                installed.append(language_code)
+        if not self.pending and self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        return installed
+
+    def cache_file(self, language_code: str) -> str:
+        return os.path.join(self.cache_dir, f"{language_code}.marshal")
+
+    def read_cache(self, language_code: str, signature: list) -> dict[str, str]:
+        """
+        Read the compiled table of a language, if it was compiled from the
+        current version of its file.
+        """
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self.cache_file(language_code), "rb") as file:
+                cached_signature, table = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if cached_signature != signature:
+            return None
+        return {sys.intern(key): value for key, value in table.items()}
+
+    def write_cache(self, language_code: str, signature: list, table: dict) -> None:
+        """
+        Store the compiled table of a language.
+        """
+        if not self.cache_dir:
+            return
+        path = self.cache_file(language_code)
         try:
-            return self.data[language_code][key]
-        except KeyError:
-            self.logger.error(f"Key not found: {key}")
+            with open(f"{path}.tmp", "wb") as file:
+                marshal.dump((signature, table), file)
+            os.replace(f"{path}.tmp", path)
+        except OSError as exc:
+            self.logger.error(f"Error caching {language_code}: {exc}")
+
+    def get(self, key: str, language_code: str) -> str:
+        """
+        Get a text by its dotted key, from the language or its fallbacks.
+        Missing keys are logged once and returned as the text.
+        Eg: get("menu.play", "es")
+        """
+        lookup = self.lookups.get(language_code)
+        if lookup is None:
+            lookup = self.lookups.get(GameConfig.DEFAULT_LANGUAGE, {})
+        text = lookup.get(key)
+        if text is None:
+            if (language_code, key) not in self.missing:
+                self.missing.add((language_code, key))
+                self.logger.error(f"Key not found: {key} ({language_code})")
             return key
+        return text
+
+    def get_key(self, key: str, language_code: str) -> dict:
+        """
+        Get a specific section from the localization data.
+        Eg: get_key("planets", "es")
+        """
+        prefix = f"{key}."
+        lookup = self.lookups.get(language_code, {})
+        section = {
+            name[len(prefix) :]: text
+            for name, text in lookup.items()
+            if name.startswith(prefix)
+        }
+        if not section:
+            self.get(key, language_code)
+        return section
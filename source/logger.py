@@ -1,18 +1,67 @@
 """
 This module contains the custom logger class for the application.
+
+Every logger puts its records in a queue shared by all the loggers of the
+same file, and a single background thread writes them to the file and the
+console, so logging never waits for I/O.
+
+In structured mode (see `enable_ring_buffer`) debug records are only kept
+in memory, unformatted, and written to a JSONL file when needed.
 """
 
+import json
+import queue
+import atexit
 import logging
+import threading
+from time import time
+from logging.handlers import QueueHandler, QueueListener
 
+# the formats don't show them, so they aren't looked up for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
-class UCLogger(logging.Logger):
+_queue_handlers: dict[str, QueueHandler] = {}
+_queue_handlers_lock: threading.Lock = threading.Lock()
+_ring_buffer: "LogRingBuffer" = None
+
+
+class DeferredQueueHandler(QueueHandler):
     """
-    Custom logger class for the application.
+    A queue handler that leaves formatting the records to the writer thread.
     """
 
-    def __init__(self, name: str, level=logging.DEBUG, filename="app.log"):
-        super().__init__(name, level)
-        self.setLevel(level)
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # the records aren't shared with other handlers, so unlike the base
+        # class they are neither copied nor formatted here
+        return record
+
+
+class ConsoleFilter(logging.Filter):
+    """
+    Drops the records logged with `console=False`.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return getattr(record, "console", True)
+
+
+def get_queue_handler(filename: str) -> QueueHandler:
+    """
+    Get the handler that queues the records of a file for its writer
+    thread, starting the thread the first time.
+
+    Args:
+        filename (str): The file the records are written to.
+
+    Returns:
+        QueueHandler: The handler shared by the loggers of the file.
+    """
+    with _queue_handlers_lock:
+        queue_handler = _queue_handlers.get(filename)
+        if queue_handler is not None:
+            return queue_handler
 
         # File handler
         file_handler = logging.FileHandler(filename)
@@ -20,23 +69,161 @@ class UCLogger(logging.Logger):
         file_handler.setFormatter(
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
-        self.addHandler(file_handler)
 
         # Console handler
-        self.console_handler = logging.StreamHandler()
-        self.console_handler.setLevel(logging.DEBUG)
-        self.console_handler.setFormatter(
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.DEBUG)
+        console_handler.setFormatter(
             logging.Formatter("%(name)s - %(levelname)s - %(message)s")
         )
-        self.addHandler(self.console_handler)
+        console_handler.addFilter(ConsoleFilter())
+
+        records = queue.SimpleQueue()
+        queue_handler = DeferredQueueHandler(records)
+        listener = QueueListener(
+            records, file_handler, console_handler, respect_handler_level=True
+        )
+        listener.start()
+        # writes the records still queued when the game exits
+        atexit.register(listener.stop)
+        _queue_handlers[filename] = queue_handler
+        return queue_handler
+
+
+class LogRingBuffer:
+    """
+    Keeps the last records logged as (timestamp, logger name, level,
+    message template, args) tuples in a preallocated list, overwriting the
+    oldest ones. Messages are only formatted when the records are read.
+    """
+
+    def __init__(self, capacity: int, filename: str):
+        """
+        Create a new ring buffer.
+
+        Args:
+            capacity (int): The number of records kept.
+            filename (str): The JSONL file the records are flushed to.
+        """
+        self.capacity: int = capacity
+        self.filename: str = filename
+        self.records: list[tuple] = [None] * capacity
+        self.index: int = 0
+        self.count: int = 0
+        self.lock: threading.Lock = threading.Lock()
+
+    def append(self, name: str, level: int, message: str, args: tuple) -> None:
+        """
+        Store a record, overwriting the oldest one if the buffer is full.
+        """
+        record = (time(), name, level, message, args)
+        with self.lock:
+            self.records[self.index] = record
+            self.index = (self.index + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def snapshot(self) -> list[tuple]:
+        """
+        Get the records stored, from the oldest to the newest.
+        """
+        with self.lock:
+            return self.ordered()
+
+    def ordered(self) -> list[tuple]:
+        # must be called with the lock held
+        start = (self.index - self.count) % self.capacity
+        if start + self.count <= self.capacity:
+            return self.records[start : start + self.count]
+        return self.records[start:] + self.records[: self.index]
+
+    @staticmethod
+    def format(record: tuple) -> dict:
+        """
+        Format a record as a dict with its message.
+        """
+        created, name, level, message, args = record
+        try:
+            text = str(message) % args if args else str(message)
+        except (TypeError, ValueError):
+            text = f"{message} {args}"
+        return {
+            "time": created,
+            "logger": name,
+            "level": logging.getLevelName(level),
+            "message": text,
+        }
+
+    def flush(self) -> int:
+        """
+        Append the records stored to the JSONL file and empty the buffer.
+
+        Returns:
+            int: The number of records written.
+        """
+        with self.lock:
+            records = self.ordered()
+            self.count = 0
+        if not records:
+            return 0
+        with open(self.filename, "a", encoding="utf-8") as file:
+            for record in records:
+                file.write(json.dumps(self.format(record), default=str) + "\n")
+        return len(records)
+
+
+def enable_ring_buffer(capacity: int, filename: str) -> LogRingBuffer:
+    """
+    Switch every logger to structured mode: debug records are stored in a
+    ring buffer instead of being written, and the buffer is flushed to a
+    JSONL file when an error is logged. Records of other levels are stored
+    in the buffer and also written as usual.
+
+    Args:
+        capacity (int): The number of records kept.
+        filename (str): The JSONL file the records are flushed to.
+
+    Returns:
+        LogRingBuffer: The buffer, to flush on demand.
+    """
+    global _ring_buffer
+    if _ring_buffer is None:
+        _ring_buffer = LogRingBuffer(capacity, filename)
+    return _ring_buffer
+
+
+def get_ring_buffer() -> LogRingBuffer | None:
+    """
+    Get the ring buffer of the structured mode, None if it isn't enabled.
+    """
+    return _ring_buffer
+
+
+class UCLogger(logging.Logger):
+    """
+    Custom logger class for the application.
+    """
+
+    def __init__(self, name: str, level=logging.DEBUG, filename="app.log"):
+        super().__init__(name, level)
+        self.setLevel(level)
+        self.addHandler(get_queue_handler(filename))
+
+    def findCaller(self, stack_info: bool = False, stacklevel: int = 1) -> tuple:
+        # the formats don't show where a record was logged from, so the
+        # stack isn't walked to find it
+        return "(unknown file)", 0, "(unknown function)", None
 
     def __log(
         self, level: int, message: str, *args, console: bool = True, **kwargs
     ) -> None:
-        if console:
-            self.console_handler.setLevel(level)
-        else:
-            self.console_handler.setLevel(logging.CRITICAL + 1)
+        if _ring_buffer is not None and self.isEnabledFor(level):
+            _ring_buffer.append(self.name, level, message, args)
+            if level >= logging.ERROR:
+                _ring_buffer.flush()
+            elif level < logging.INFO:
+                return
+        # the flag travels with the record, the console handler filters on it
+        kwargs["extra"] = {**kwargs.get("extra", {}), "console": console}
         super().log(level, message, *args, **kwargs)
 
     def info(self, message: str, *args, console: bool = True, **kwargs) -> None:
@@ -2,7 +2,9 @@
 This module is responsible for playing music in the game.
 """
 
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 import pygame as pyg
 from source.constants import ResourceConfig
 from source.logger import get_logger
@@ -12,8 +14,26 @@ from source.components.notification import Notification
 class Music:
     """
     This class is responsible for playing music in the game.
+
+    While a track plays, the next one is read in a background thread and
+    queued in the mixer, so it starts as soon as the current one ends.
+    Optionally, tracks fade in and out, stepped by a timer.
     """
 
+    END_EVENT: int = pyg.USEREVENT + 1
+    # the next track was read in the background
+    PREFETCH_EVENT: int = pyg.USEREVENT + 2
+    # a step of the current fade
+    FADE_EVENT: int = pyg.USEREVENT + 3
+    # the current track is about to end, start fading out
+    FADE_OUT_EVENT: int = pyg.USEREVENT + 4
+    EVENT_TYPES: tuple[int, ...] = (
+        END_EVENT,
+        PREFETCH_EVENT,
+        FADE_EVENT,
+        FADE_OUT_EVENT,
+    )
+
     def __init__(self, music_path: str, debug: bool = False):
         """
         Initialize the music class.
@@ -26,18 +46,34 @@ class Music:
         self.current_track: int = 0
         self.playlist: list[dict] = []
         self.paused: bool = False
+        self.volume: float = 1.0
+        self.executor: ThreadPoolExecutor = None
+        # the index and contents of the track queued after the current one,
+        # the contents of the current one, kept alive while the mixer reads them
+        self.queued: int = None
+        self.queued_file: io.BytesIO = None
+        self.current_file: io.BytesIO = None
+        # fades, lengths are only known for tracks read in the background
+        self.fade_ms: int = ResourceConfig.MUSIC_FADE_MS
+        self.fade_level: float = 1.0
+        self.fade_direction: int = 0
+        self.lengths: dict[int, float] = {}
         self.notification: Notification = Notification(
             uniqueId="music", message="Initializing music..."
         )
 
-    def init_music(self) -> None:
+    def init_music(self, font: pyg.font.Font = None) -> None:
         """
         Initialize the music.
+
+        Args:
+            font (pyg.font.Font): The font to use for the notifications.
         """
         pyg.mixer.init()
-        pyg.mixer.music.set_endevent(pyg.USEREVENT + 1)
+        pyg.mixer.music.set_endevent(self.END_EVENT)
         self.music = pyg.mixer.music
-        self.notification.init()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music")
+        self.notification.init(font)
 
         for music_item in ResourceConfig.MUSICS:
             self.load_music(music_item)
@@ -70,10 +106,117 @@ class Music:
         track = self.playlist[self.current_track]
         music_file = track["file"]
         self.logger.info(f"Playing {track['name']} ({music_file}).")
+        self.queued = self.queued_file = self.current_file = None
         self.music.load(music_file)
         self.music.play()
         self.paused = False
         self.notification.message = f"Playing {track['name']}."
+        self.on_track_started()
+
+    def on_track_started(self) -> None:
+        """
+        Fade in the current track, and start reading the next one.
+        """
+        if self.fade_ms:
+            self.fade_level = 0.0
+            self.start_fade(1)
+            self.schedule_fade_out()
+        next_track = (self.current_track + 1) % len(self.playlist)
+        self.executor.submit(self.read_track, next_track)
+
+    def read_track(self, index: int) -> None:
+        """
+        Read a track and post it to be queued. Runs in the background thread.
+
+        Args:
+            index (int): The index of the track in the playlist.
+        """
+        track = self.playlist[index]
+        try:
+            with open(track["file"], "rb") as file:
+                data = file.read()
+            # the mixer doesn't tell the length of the music, so with fades
+            # the track is decoded once, here in the background, to measure
+            # it, and the samples are freed right away
+            length = None
+            if self.fade_ms:
+                sound = pyg.mixer.Sound(io.BytesIO(data))
+                length = sound.get_length()
+                del sound
+        except (OSError, pyg.error) as exc:
+            self.logger.error(f"Error reading {track['name']}: {exc}")
+            return
+        pyg.event.post(
+            pyg.event.Event(self.PREFETCH_EVENT, index=index, data=data, length=length)
+        )
+
+    def queue_track(self, event: pyg.event.Event) -> None:
+        """
+        Queue a track read in the background to follow the current one.
+        """
+        next_track = (self.current_track + 1) % len(self.playlist)
+        playing = self.music.get_busy() or self.paused
+        if event.index != next_track or self.queued is not None or not playing:
+            return
+        extension = os.path.splitext(self.playlist[event.index]["file"])[1]
+        self.queued_file = io.BytesIO(event.data)
+        self.music.queue(self.queued_file, extension.lstrip("."))
+        self.queued = event.index
+        self.lengths[event.index] = event.length
+        self.logger.debug(f"Queued {self.playlist[event.index]['name']}.")
+
+    def next_track(self) -> None:
+        """
+        Move to the next track once the current one ends: the queued track,
+        already playing, or else the next one, loaded now.
+        """
+        if self.queued is None:
+            self.current_track = (self.current_track + 1) % len(self.playlist)
+            self.play_current_track()
+            return
+        self.current_track = self.queued
+        self.current_file = self.queued_file
+        self.queued = self.queued_file = None
+        track = self.playlist[self.current_track]
+        self.logger.info(f"Playing {track['name']} ({track['file']}).")
+        self.notification.message = f"Playing {track['name']}."
+        self.on_track_started()
+
+    def start_fade(self, direction: int) -> None:
+        """
+        Start fading the music in (1) or out (-1).
+        """
+        self.fade_direction = direction
+        pyg.time.set_timer(self.FADE_EVENT, ResourceConfig.MUSIC_FADE_STEP_MS)
+        self.apply_volume()
+
+    def schedule_fade_out(self) -> None:
+        """
+        Start fading out the current track when it is about to end, if its length is known.
+        """
+        length = self.lengths.get(self.current_track)
+        pyg.time.set_timer(self.FADE_OUT_EVENT, 0)
+        if length is None:
+            return
+        remaining = int(length * 1000) - self.music.get_pos() - self.fade_ms
+        pyg.time.set_timer(self.FADE_OUT_EVENT, max(1, remaining), loops=1)
+
+    def fade_step(self) -> None:
+        """
+        Move the fade one step further, stopping the timer once it is done.
+        """
+        step = ResourceConfig.MUSIC_FADE_STEP_MS / self.fade_ms * self.fade_direction
+        self.fade_level = min(1.0, max(0.0, self.fade_level + step))
+        if self.fade_level in (0.0, 1.0):
+            self.fade_direction = 0
+            pyg.time.set_timer(self.FADE_EVENT, 0)
+        self.apply_volume()
+
+    def apply_volume(self) -> None:
+        """
+        Set the volume of the mixer, with the current fade.
+        """
+        self.music.set_volume(self.volume * self.fade_level)
 
     def play_music(self) -> None:
         """
@@ -90,6 +233,10 @@ class Music:
         """
         Stop the music.
         """
+        self.queued = self.queued_file = None
+        pyg.time.set_timer(self.FADE_OUT_EVENT, 0)
+        pyg.time.set_timer(self.FADE_EVENT, 0)
+        self.fade_direction = 0
         self.music.stop()
         self.paused = False
 
@@ -100,6 +247,8 @@ class Music:
         if self.paused:
             self.music.unpause()
             self.paused = False
+            if self.fade_ms:
+                self.schedule_fade_out()
             if self.debug:
                 self.logger.info("Music unpaused.")
             self.notification.message = (
@@ -108,6 +257,7 @@ class Music:
         else:
             self.music.pause()
             self.paused = True
+            pyg.time.set_timer(self.FADE_OUT_EVENT, 0)
             if self.debug:
                 self.logger.info("Music paused.")
             self.notification.message = "Music paused."
@@ -117,7 +267,9 @@ class Music:
         """
         Set the volume of the music.
         """
-        self.music.set_volume(volume)
+        self.volume = volume
+        if self.music is not None:
+            self.apply_volume()
         self.logger.info(f"Volume set to {volume}.")
 
     @property
@@ -125,16 +277,21 @@ class Music:
         """
         Get the volume of the music.
         """
-        return self.music.get_volume()
+        return self.volume
 
     def handle_event(self, event: pyg.event.Event) -> None:
         """
         Handle events related to music playback.
         """
-        if event.type == pyg.USEREVENT + 1:
-            self.current_track = (self.current_track + 1) % len(self.playlist)
+        if event.type == self.END_EVENT:
+            self.next_track()
             if self.debug:
                 self.logger.debug(
                     f"Next track: {self.playlist[self.current_track]['name']}"
                 )
-            self.play_current_track()
+        elif event.type == self.PREFETCH_EVENT:
+            self.queue_track(event)
+        elif event.type == self.FADE_EVENT:
+            self.fade_step()
+        elif event.type == self.FADE_OUT_EVENT:
+            self.start_fade(-1)
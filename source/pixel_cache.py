@@ -0,0 +1,128 @@
+"""
+This module contains the PixelCache class, an on-disk cache of decoded and scaled images.
+"""
+
+import os
+import glob
+import struct
+import hashlib
+import pygame as pyg
+from .logger import get_logger
+
+HEADER: struct.Struct = struct.Struct("<II")
+
+
+class PixelCache:
+    """
+    An on-disk cache of the raw pixels of decoded (and optionally scaled)
+    images, so later starts load them with `pyg.image.frombuffer` instead of
+    decoding the PNG files again.
+
+    Entries are keyed by the hash of the source file, the target size and the
+    pixel format, so an entry becomes stale as soon as its source changes.
+    Each entry is the width and height of the image (two little-endian
+    unsigned ints) followed by its pixels.
+    """
+
+    FORMAT: str = "RGBA"
+
+    def __init__(self, cache_dir: str):
+        """
+        Create a new pixel cache.
+
+        Args:
+            cache_dir (str): The directory where the entries are stored.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.dir: str = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def entry_name(self, name: str, digest: str, size: tuple[int, int]) -> str:
+        """
+        Get the file name of the entry of an image.
+
+        Args:
+            name (str): The name of the image. Eg. "planets/earth.png".
+            digest (str): The hash of the contents of the source file, "*" to match any.
+            size (tuple[int, int]): The target size, None for the original size.
+
+        Returns:
+            str: The file name of the entry.
+        """
+        prefix = name.replace("/", "_").replace(".", "_")
+        label = "full" if size is None else f"{size[0]}x{size[1]}"
+        return f"{prefix}-{digest}-{label}-{self.FORMAT}.raw"
+
+    def load(
+        self,
+        name: str,
+        data: bytes,
+        decode: callable,
+        size: tuple[int, int] = None,
+        digest: str = None,
+    ) -> pyg.Surface:
+        """
+        Load an image from the cache, decoding and storing it on a miss.
+
+        Args:
+            name (str): The name of the image. Eg. "planets/earth.png".
+            data (bytes): The contents of the source file.
+            decode (callable): The function that decodes (and scales) the image.
+            size (tuple[int, int]): The target size, None for the original size.
+            digest (str): The SHA-256 of the contents, computed if not given.
+
+        Returns:
+            pyg.Surface: The image.
+        """
+        digest = (digest or hashlib.sha256(data).hexdigest())[:16]
+        path = os.path.join(self.dir, self.entry_name(name, digest, size))
+        try:
+            surface = self.read(path)
+            self.hits += 1
+            return surface
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, struct.error) as exc:
+            self.logger.warning(f"Discarding the pixels of {name}: {exc}")
+
+        self.misses += 1
+        surface = decode()
+        self.write(name, path, size, surface)
+        return surface
+
+    def read(self, path: str) -> pyg.Surface:
+        """
+        Read the pixels of an entry.
+        """
+        with open(path, "rb") as file:
+            width, height = HEADER.unpack(file.read(HEADER.size))
+            pixels = file.read()
+        return pyg.image.frombuffer(pixels, (width, height), self.FORMAT)
+
+    def write(
+        self, name: str, path: str, size: tuple[int, int], surface: pyg.Surface
+    ) -> None:
+        """
+        Store the pixels of an image, removing the stale entries of the same
+        image and size.
+        """
+        pattern = glob.escape(self.entry_name(name, "", size)).replace("--", "-*-", 1)
+        for stale in glob.glob(os.path.join(glob.escape(self.dir), pattern)):
+            os.remove(stale)
+        temporary = f"{path}.tmp"
+        try:
+            with open(temporary, "wb") as file:
+                file.write(HEADER.pack(*surface.get_size()))
+                file.write(pyg.image.tobytes(surface, self.FORMAT))
+            os.replace(temporary, path)
+        except OSError as exc:
+            self.logger.error(f"Error writing the pixels of {name}: {exc}")
+
+    @property
+    def stats(self) -> dict:
+        """
+        Get the hits and misses of the cache.
+        """
+        return {"hits": self.hits, "misses": self.misses}
@@ -3,10 +3,18 @@ This module is responsible for loading resources from the disk.
 Resources are images, sounds, and other files that are used in the game.
 """
 
+import io
 import os
+from time import perf_counter
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import pygame as pyg
 from .logger import get_logger
 from .constants import ResourceConfig
+from .surface_cache import SurfaceCache, LazySurfaces
+from .asset_bundle import AssetBundle
+from .pixel_cache import PixelCache
+from .sprite_atlas import SpriteAtlas
+from .sound_bank import SoundBank
 
 
 class ResourceLoader:
@@ -14,39 +22,429 @@ class ResourceLoader:
     This class is responsible for loading resources from the disk.
     """
 
-    def __init__(self, resource_dir: str = "resources"):
+    def __init__(
+        self,
+        resource_dir: str = "resources",
+        lazy: bool = ResourceConfig.LAZY_LOADING,
+        memory_budget: int = ResourceConfig.IMAGE_MEMORY_BUDGET,
+    ):
+        """
+        Initialize the resource loader.
+
+        Args:
+            resource_dir (str): The directory of the resources.
+            lazy (bool): Whether to load images on first access instead of
+                all of them at startup.
+            memory_budget (int): The maximum number of bytes of images kept
+                in memory when loading lazily.
+        """
         self.logger = get_logger(self.__class__.__name__)
         if not os.path.isdir(resource_dir):
             msg = f"Directory '{resource_dir}' not found."
             self.logger.error(msg)
             raise FileNotFoundError(msg)
         self.dir = resource_dir
-        self.fonts = {}
+        self.fonts: dict[tuple[str, int], pyg.font.Font] = {}
         self.images = {}
-        self.sounds = {}
+        self.sounds: SoundBank = SoundBank(
+            ResourceConfig.SOUND_CHANNELS, self.load_sound
+        )
         self.planets: dict = {}
+        self.lazy: bool = lazy
+        self.surface_cache: SurfaceCache = SurfaceCache(
+            memory_budget,
+            lambda path, size: self.prepare_image(self.load_image(path, size)),
+        )
+        self.bundle: AssetBundle = None
+        if os.path.isfile(ResourceConfig.BUNDLE_FILE):
+            try:
+                self.bundle = AssetBundle(ResourceConfig.BUNDLE_FILE)
+            except (ValueError, OSError) as exc:
+                self.logger.warning(f"Using the loose resources: {exc}")
+        self.pixel_cache: PixelCache = None
+        if ResourceConfig.PIXEL_CACHE:
+            self.pixel_cache = PixelCache(ResourceConfig.PIXEL_CACHE_DIR)
+        self.image_paths: dict[str, str] = {
+            "screen_loading": os.path.join(self.dir, "screen_loading.png"),
+            "logo": os.path.join(self.dir, "logo.png"),
+        }
+        self.atlas: SpriteAtlas = SpriteAtlas(ResourceConfig.ATLAS_PAGE_SIZE)
+        self.executor: ThreadPoolExecutor = None
+        self.pending: dict[Future, tuple[dict, str, str]] = {}
+        self.loaded: int = 0
+        self.total: int = 0
+        self.conversions: int = 0
+        self.conversion_time: float = 0.0
 
     def load_all_fonts(self) -> None:
-        pass
+        """
+        Load all the fonts used by the game.
+        """
+        for face, size in ResourceConfig.FONTS:
+            self.get_font(face, size)
+
+    def get_font(self, face: str = None, size: int = 24) -> pyg.font.Font:
+        """
+        Get a font, loading it only the first time it is requested.
+        The same instance is shared by every caller.
+
+        Args:
+            face (str): The font file in the fonts directory, None for the default one.
+            size (int): The size of the font.
+
+        Returns:
+            pyg.font.Font: The font.
+        """
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            path = os.path.join(ResourceConfig.FONTS_DIR, face) if face else None
+            font = pyg.font.Font(path, size)
+            self.fonts[key] = font
+            self.logger.info(f"Font {face or 'default'} ({size}) loaded.")
+        return font
+
+    @property
+    def font_count(self) -> int:
+        """
+        Get the number of fonts loaded.
+        """
+        return len(self.fonts)
 
     def load_all_images(self) -> None:
-        self.images["screen_loading"] = pyg.image.load(
-            os.path.join(self.dir, "screen_loading.png")
-        )
-        self.images["logo"] = pyg.image.load(os.path.join(self.dir, "logo.png"))
+        """
+        Load all images, blocking until they are ready.
+        """
+        self.start_loading_images()
+        self.wait()
 
+    def start_loading_images(self) -> None:
         """
-        Load all image planets
+        Start loading all images in a pool of background threads.
+
+        Files are read and decoded in the background, and the surfaces are
+        converted to the display format in `poll`, on the main thread.
+        In lazy mode nothing is loaded, the images are loaded on first access.
         """
+        if self.lazy:
+            self.start_lazy_loading()
+            return
+        jobs = [
+            (self.images, key, path, ResourceConfig.IMAGE_SIZES.get(key))
+            for key, path in self.image_paths.items()
+        ]
         for item, item_path in ResourceConfig.PLANETS.items():
+            jobs.append(
+                (
+                    self.planets,
+                    item,
+                    os.path.join(ResourceConfig.PLANETS_DIR, item_path),
+                    None,
+                )
+            )
+
+        self.loaded = 0
+        self.total = len(jobs)
+        self.executor = ThreadPoolExecutor(
+            max_workers=ResourceConfig.LOADER_WORKERS, thread_name_prefix="loader"
+        )
+        for target, key, path, size in jobs:
+            future = self.executor.submit(self.load_image_job, path, size)
+            self.pending[future] = (target, key, path)
+        self.logger.info(f"Loading {len(jobs)} images in the background.")
+
+    def start_lazy_loading(self) -> None:
+        """
+        Set up the images to be loaded on first access through the surface cache.
+        """
+        self.images = LazySurfaces(self.surface_cache, self.image_paths)
+        self.planets = LazySurfaces(
+            self.surface_cache,
+            {
+                item: os.path.join(ResourceConfig.PLANETS_DIR, item_path)
+                for item, item_path in ResourceConfig.PLANETS.items()
+            },
+        )
+        self.logger.info("Images will be loaded on demand.")
+
+    @property
+    def image_stats(self) -> dict:
+        """
+        Get the memory statistics of the loaded images.
+
+        Returns:
+            dict: The resident bytes, and in lazy mode the hits, misses and
+                evictions of the surface cache. Once the cards are packed,
+                the statistics of the atlas too.
+        """
+        if self.lazy:
+            return self.surface_cache.stats
+        if not self.atlas.pages:
+            surfaces = [*self.images.values(), *self.planets.values()]
+            return {
+                "surfaces": len(surfaces),
+                "resident_bytes": sum(map(SurfaceCache.surface_size, surfaces)),
+            }
+        # the cards are subsurfaces, their pixels are counted in the pages
+        surfaces = list(self.images.values())
+        atlas = self.atlas.stats
+        return {
+            "surfaces": len(surfaces) + atlas["pages"],
+            "resident_bytes": sum(map(SurfaceCache.surface_size, surfaces))
+            + atlas["resident_bytes"],
+            "atlas": atlas,
+        }
+
+    def load_image(self, path: str, size: tuple[int, int] = None) -> pyg.Surface:
+        """
+        Decode an image from the asset bundle if it has it, or from the disk.
+        With the pixel cache enabled, the decoded pixels are read from it when
+        the source hasn't changed since they were stored.
+
+        Args:
+            path (str): The path of the image. Eg. "resources/logo.png".
+            size (tuple[int, int]): The size to scale the image to, None to keep it.
+
+        Returns:
+            pyg.Surface: The decoded image.
+        """
+        name, data, digest = self.read_resource(path)
+
+        def decode() -> pyg.Surface:
+            # pygame decodes from file objects, so the bytes are wrapped
+            image = pyg.image.load(io.BytesIO(data), name)
+            return image if size is None else pyg.transform.scale(image, size)
+
+        if self.pixel_cache is None:
+            return decode()
+        return self.pixel_cache.load(name, data, decode, size, digest)
+
+    def read_resource(self, path: str) -> tuple[str, bytes, str | None]:
+        """
+        Read the contents of a resource from the asset bundle if it has it,
+        or from the disk. Loose files changed after the bundle was built are
+        read from the disk, so an outdated bundle never hides them.
+
+        Args:
+            path (str): The path of the resource. Eg. "resources/logo.png".
+
+        Returns:
+            tuple[str, bytes, str | None]: The name of the resource in the
+                bundle, its contents (a view of the bundle when read from it),
+                and the SHA-256 hash from the bundle index, None when read
+                from the disk.
+        """
+        name = os.path.relpath(path, self.dir).replace(os.sep, "/")
+        if self.bundle is not None and name in self.bundle:
+            if not self.bundle.is_outdated(path):
+                return name, self.bundle.get(name), self.bundle.entries[name]["sha256"]
+            self.logger.warning(f"{name} is newer than the asset bundle.")
+        with open(path, "rb") as file:
+            return name, file.read(), None
+
+    def get_scaled_image(self, key: str, size: tuple[int, int]) -> pyg.Surface:
+        """
+        Get one of the images of the game scaled to a size. The image loaded
+        in the background is returned when it has that size (see
+        ResourceConfig.IMAGE_SIZES), otherwise it is read from the pixel
+        cache, or decoded and scaled, on the calling thread. In lazy mode
+        the scaled image is kept in the surface cache, within its budget.
+
+        Args:
+            key (str): The key of the image. Eg. "logo".
+            size (tuple[int, int]): The size to scale the image to.
+
+        Returns:
+            pyg.Surface: The scaled image, in the pixel format of the display.
+                It may be shared, so it must not be drawn on.
+        """
+        if self.lazy:
+            # counted against the memory budget, and decoded once
+            return self.surface_cache.get(self.image_paths[key], size)
+        image = self.images.get(key)
+        if image is not None and image.get_size() == tuple(size):
+            return image
+        return self.prepare_image(self.load_image(self.image_paths[key], size))
+
+    def get_loaded_image(self, key: str) -> pyg.Surface | None:
+        """
+        Get one of the images of the game at its size in
+        ResourceConfig.IMAGE_SIZES, without waiting for it to load.
+        In lazy mode it is loaded right away.
+
+        Args:
+            key (str): The key of the image. Eg. "screen_loading".
+
+        Returns:
+            pyg.Surface | None: The image, None while it is still loading.
+        """
+        if self.lazy:
+            return self.get_scaled_image(key, ResourceConfig.IMAGE_SIZES[key])
+        return self.images.get(key)
+
+    def load_image_job(
+        self, path: str, size: tuple[int, int] = None
+    ) -> tuple[pyg.Surface, bool]:
+        """
+        Load an image and check whether it is opaque, the part of the loading
+        done in the background threads.
+
+        Args:
+            path (str): The path of the image.
+            size (tuple[int, int]): The size to scale the image to, None to keep it.
+
+        Returns:
+            tuple[pyg.Surface, bool]: The decoded image and whether it is opaque.
+        """
+        image = self.load_image(path, size)
+        return image, self.is_opaque(image)
+
+    @staticmethod
+    def is_opaque(image: pyg.Surface) -> bool:
+        """
+        Check if every pixel of an image is fully opaque.
+
+        Args:
+            image (pyg.Surface): The image.
+
+        Returns:
+            bool: True if the image doesn't need an alpha channel.
+        """
+        if not image.get_flags() & pyg.SRCALPHA:
+            return True
+        # the mask has a bit set for every pixel with an alpha above 254
+        opaque_pixels = pyg.mask.from_surface(image, 254).count()
+        return opaque_pixels == image.get_width() * image.get_height()
+
+    def prepare_image(self, image: pyg.Surface, opaque: bool = None) -> pyg.Surface:
+        """
+        Convert a loaded image to the pixel format of the display, so blitting
+        it doesn't convert every pixel. Opaque images are converted without an
+        alpha channel, which blits faster than blending.
+        Must be called on the main thread, after the display is set.
+
+        Args:
+            image (pyg.Surface): The image as loaded from the disk.
+            opaque (bool): Whether the image is opaque, checked if not given.
+
+        Returns:
+            pyg.Surface: The converted image.
+        """
+        start = perf_counter()
+        if opaque is None:
+            opaque = self.is_opaque(image)
+        image = image.convert() if opaque else image.convert_alpha()
+        self.conversions += 1
+        self.conversion_time += perf_counter() - start
+        return image
+
+    @property
+    def conversion_stats(self) -> dict:
+        """
+        Get the number of images converted to the display format and the
+        time spent converting them, in milliseconds.
+        """
+        return {
+            "conversions": self.conversions,
+            "time_ms": self.conversion_time * 1000,
+        }
+
+    def poll(self) -> None:
+        """
+        Store the images that finished loading in the background.
+        Must be called on the main thread.
+        """
+        finished = [future for future in self.pending if future.done()]
+        for future in finished:
+            target, key, path = self.pending.pop(future)
+            self.loaded += 1
             try:
-                path = os.path.join(ResourceConfig.PLANETS_DIR, item_path)
-                self.planets[item] = pyg.image.load(path)
+                target[key] = self.prepare_image(*future.result())
             except Exception as exc:
-                self.logger.error(
-                    f"Error loading planetId {item} from {path}, not found."
-                )
+                self.logger.error(f"Error loading image {key} from {path}, not found.")
                 self.logger.error(exc, console=False)
+        if not self.pending and self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+            self.logger.info(
+                f"All images loaded, {self.conversion_time * 1000:.1f} ms "
+                f"spent converting {self.conversions} of them."
+            )
+            self.build_atlas()
+
+    def build_atlas(self) -> None:
+        """
+        Pack the card images into the atlas, and replace them with
+        subsurfaces of its pages so the separate surfaces are freed.
+        """
+        self.atlas.build(self.planets, ResourceConfig.CARD_SIZES)
+        self.planets = {key: self.atlas.get(key) for key in self.planets}
+
+    def get_card(self, card_id: int, size: tuple[int, int] = None) -> pyg.Surface:
+        """
+        Get the image of a card.
+
+        Args:
+            card_id (int): The id of the card, a key of ResourceConfig.PLANETS.
+            size (tuple[int, int]): One of ResourceConfig.CARD_SIZES, None
+                for the size of the image.
+
+        Returns:
+            pyg.Surface: The image, a subsurface of the atlas when it is
+                packed in it (not in lazy mode), so it must not be drawn on.
+        """
+        if card_id in self.atlas:
+            return self.atlas.get(card_id, size)
+        image = self.planets[card_id]
+        if size is None or image.get_size() == tuple(size):
+            return image
+        return pyg.transform.smoothscale(image, size)
+
+    def wait(self) -> None:
+        """
+        Block until every image has finished loading.
+        """
+        wait(list(self.pending))
+        self.poll()
+
+    @property
+    def loading(self) -> bool:
+        """
+        Check if images are still loading in the background.
+        """
+        return bool(self.pending)
+
+    @property
+    def progress(self) -> float:
+        """
+        Get the progress of the loading, from 0 to 1.
+        """
+        if not self.total:
+            return 1.0
+        return self.loaded / self.total
+
+    def load_sound(self, path: str) -> pyg.mixer.Sound:
+        """
+        Decode a sound from the asset bundle if it has it, or from the disk.
+
+        Args:
+            path (str): The path of the sound. Eg. "resources/sounds/click.wav".
+
+        Returns:
+            pyg.mixer.Sound: The decoded sound.
+        """
+        _, data, _ = self.read_resource(path)
+        return pyg.mixer.Sound(file=io.BytesIO(data))
 
     def load_all_sounds(self) -> None:
-        pass
+        """
+        Reserve the channels of the sound effects and decode them, unless they
+        are loaded lazily. Must be called after the mixer is initialized.
+        """
+        self.sounds.init()
+        for name, (file, priority) in ResourceConfig.SOUNDS.items():
+            self.sounds.register(
+                name, os.path.join(ResourceConfig.SOUNDS_DIR, file), priority
+            )
+        if not self.lazy:
+            self.sounds.preload()
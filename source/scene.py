@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 import pygame as pyg
 from typing import TYPE_CHECKING
 from .logger import get_logger, UCLogger
+from .constants import Colors
+from .spatial_grid import SpatialGrid
 
 if TYPE_CHECKING:
     from .controller import Controller
@@ -30,6 +32,102 @@ class Scene(ABC):
         self.debug: bool = debug
         self.logger: UCLogger = get_logger(self.name or self.__class__.__name__)
         self.done: bool = False
+        self.dirty_rects: list[pyg.Rect] = []
+        self.full_redraw: bool = True
+        self.static_layer: pyg.Surface = None
+        self.static_components: set = set()
+        self.built: bool = False
+        self.lang: str = None
+        self.localized: dict = {}
+        self.hit_grid: SpatialGrid = None
+        self.component_order: dict = {}
+        self.active_components: set = set()
+
+    def build(self) -> None:
+        """
+        Build the component tree of the scene.
+        Called once, the first time the scene is entered; the components are
+        kept across visits.
+        """
+
+    def get_components(self) -> list:
+        """
+        Get the components of the scene, in drawing order.
+
+        Returns:
+            list[Component]: The components of the scene.
+        """
+        return []
+
+    @property
+    def event_types(self) -> set[int]:
+        """
+        Get the types of the events handled by the components of the scene.
+
+        Returns:
+            set[int]: The event types.
+        """
+        event_types = set()
+        for component in self.get_components():
+            event_types.update(component.event_types)
+        return event_types
+
+    def prepare(self) -> None:
+        """
+        Prepare the scene to be entered.
+
+        Builds the component tree on the first visit, and on later visits only
+        refreshes the localized texts if the language changed meanwhile.
+        """
+        if not self.built:
+            self.lang = self.controller.lang
+            self.build()
+            self.built = True
+        elif self.lang != self.controller.lang:
+            self.refresh_texts()
+        position = pyg.mouse.get_pos()
+        for component in self.get_components():
+            component.sync_hover(position)
+        self.active_components = {
+            component for component in self.get_components() if component.is_hovered
+        }
+
+    def translate(self, section: str, key: str) -> str:
+        """
+        Get a localized text in the current language.
+
+        Args:
+            section (str): The section of the localization file. Eg. "menu".
+            key (str): The key inside the section. Eg. "play".
+
+        Returns:
+            str: The localized text.
+        """
+        return self.controller.localizations.get(
+            f"{section}.{key}", self.controller.lang
+        )
+
+    def localize(self, component, section: str, key: str) -> None:
+        """
+        Set the text of a component to a localized text, and keep it
+        updated when the language changes.
+
+        Args:
+            component (Component): A component with a `textContent` property.
+            section (str): The section of the localization file.
+            key (str): The key inside the section.
+        """
+        self.localized[component] = (section, key)
+        component.textContent = self.translate(section, key)
+
+    def refresh_texts(self) -> None:
+        """
+        Update the localized texts of the components to the current language.
+        """
+        self.lang = self.controller.lang
+        for component, (section, key) in self.localized.items():
+            component.textContent = self.translate(section, key)
+        self.log("Texts refreshed to %s.", self.lang)
 
     @abstractmethod
     def on_enter(self):
@@ -52,6 +150,10 @@ class Scene(ABC):
         Args:
             screen (pyg.Surface): The screen to render the scene on.
             delta_time (float): The time since the last update
+
+        Returns:
+            list[pyg.Rect] | None: The areas of the screen that changed,
+                or None if the whole screen must be updated.
         """
 
     @abstractmethod
@@ -63,12 +165,183 @@ class Scene(ABC):
             event (pyg.event.Event): The event to handle.
         """
 
-    def log(self, message: str):
+    def is_animating(self) -> bool:
+        """
+        Check if the scene changes on its own, without any input.
+        While no scene is animating the controller can wait for events
+        instead of drawing frames.
+
+        Returns:
+            bool: True if the scene is animating, False otherwise.
+        """
+        return False
+
+    def needs_redraw(self) -> bool:
+        """
+        Check if the scene has pending changes to draw.
+
+        Returns:
+            bool: True if the scene must be drawn, False otherwise.
+        """
+        return self.full_redraw or bool(self.dirty_rects) or self.is_animating()
+
+    def mark_dirty(self, rect: pyg.Rect) -> None:
+        """
+        Mark an area of the screen as changed so it is redrawn on the next frame.
+        Only used when dirty rendering is enabled in the controller.
+
+        Args:
+            rect (pyg.Rect): The area to redraw.
+        """
+        if not self.controller.dirty_rendering:
+            return
+        self.dirty_rects.append(pyg.Rect(rect))
+
+    def invalidate(self) -> None:
+        """
+        Force a full redraw of the scene on the next frame.
+        """
+        self.full_redraw = True
+        self.dirty_rects.clear()
+
+    def invalidate_hit_grid(self) -> None:
+        """
+        Discard the hit-testing grid so it is rebuilt on the next pointer event.
+        Must be called whenever a component is added, moved or resized.
+        """
+        self.hit_grid = None
+
+    def build_hit_grid(self) -> None:
+        """
+        Index the components of the scene by the area they cover.
+        """
+        self.hit_grid = SpatialGrid()
+        self.component_order = {}
+        for index, component in enumerate(self.get_components()):
+            self.hit_grid.insert(component, component.rect)
+            self.component_order[component] = index
+
+    def dispatch_event(self, event: pyg.event.Event) -> None:
+        """
+        Send an event to the components that handle it.
+
+        Pointer events only go to the components under the pointer and to the
+        active ones (the ones hovered by the last pointer event, or capturing
+        the pointer like an expanded dropdown), so the cost doesn't grow with
+        the number of components. Other events go to every component that
+        handles their type.
+
+        Args:
+            event (pyg.event.Event): The event to dispatch.
+        """
+        if event.type not in (pyg.MOUSEMOTION, pyg.MOUSEBUTTONDOWN, pyg.MOUSEBUTTONUP):
+            for component in self.get_components():
+                if event.type in component.event_types:
+                    component.handle_event(event)
+            return
+        if self.hit_grid is None:
+            self.build_hit_grid()
+        targets = self.active_components.union(self.hit_grid.query(event.pos))
+        # keep the order of the components, like the full dispatch does
+        for component in sorted(targets, key=lambda c: self.component_order.get(c, -1)):
+            component.handle_event(event)
+        self.active_components = {
+            component
+            for component in targets
+            if component.is_hovered or component.captures_pointer()
+        }
+
+    def invalidate_layer(self) -> None:
+        """
+        Discard the cached static layer so it is rebuilt on the next frame.
+        Must be called whenever a component changes how it looks at rest.
+        """
+        self.static_layer = None
+        self.static_components.clear()
+        self.invalidate()
+
+    def build_static_layer(
+        self,
+        screen: pyg.Surface,
+        components: list,
+        background: tuple[int, int, int],
+    ) -> None:
+        """
+        Composite the background and every static component into an
+        off-screen surface, so they don't have to be drawn every frame.
+
+        Args:
+            screen (pyg.Surface): The screen the layer will be blitted on.
+            components (list[Component]): The components of the scene.
+            background (tuple[int, int, int]): The color of the background.
+        """
+        self.static_layer = pyg.Surface(screen.get_size(), 0, screen)
+        self.static_layer.fill(background)
+        self.static_components = {
+            component for component in components if component.is_static()
+        }
+        for component in components:
+            if component in self.static_components:
+                component.draw(self.static_layer)
+        self.log("Static layer built with %d components.", len(self.static_components))
+
+    def draw_components(
+        self,
+        screen: pyg.Surface,
+        components: list,
+        background: tuple[int, int, int] = Colors.BLACK,
+    ) -> list[pyg.Rect] | None:
+        """
+        Draw the given components on the screen.
+
+        Static components are drawn once into a cached layer which is blitted
+        as the background, and only the components that are not static
+        (eg. hovered or expanded) are drawn over it.
+        When dirty rendering is enabled only the areas marked as dirty are
+        restored from the layer.
+
+        Args:
+            screen (pyg.Surface): The screen to render the components on.
+            components (list[Component]): The components to draw, in order.
+            background (tuple[int, int, int]): The color used to clear the screen.
+
+        Returns:
+            list[pyg.Rect] | None: The areas of the screen that changed,
+                or None if the whole screen must be updated.
+        """
+        if self.static_layer is None:
+            self.build_static_layer(screen, components, background)
+        dynamic = [
+            component
+            for component in components
+            if component not in self.static_components or not component.is_static()
+        ]
+
+        if not self.controller.dirty_rendering or self.full_redraw:
+            screen.blit(self.static_layer, (0, 0))
+            for component in dynamic:
+                component.draw(screen)
+            self.full_redraw = False
+            self.dirty_rects.clear()
+            return None
+
+        rects, self.dirty_rects = self.dirty_rects, []
+        for rect in rects:
+            screen.set_clip(rect)
+            screen.blit(self.static_layer, rect, rect)
+            for component in dynamic:
+                if component.get_bounds().colliderect(rect):
+                    component.draw(screen)
+        screen.set_clip(None)
+        return rects
+
+    def log(self, message: str, *args):
         """
         Log a debug message if debugging is enabled.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, a %-style template if args are given.
+            args: The values of the template, only formatted if the message is written.
         """
         if self.debug:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
@@ -2,8 +2,10 @@
 Intro scene module.
 """
 
+import math
 import pygame as pyg
 from ..scene import Scene
+from ..constants import Colors
 
 
 class IntroScene(Scene):
@@ -23,12 +25,13 @@ class IntroScene(Scene):
         self.zoom_speed: float = 0.3
         self.time_elapsed: float = 0.0
         self.max_time: float = 3.0
-        self.background_size: tuple[int, int] = (1000, 600)
 
     def on_enter(self):
         self.log("Entering scene.")
-        self.background = self.controller.resource_loader.images["screen_loading"]
-        self.background = pyg.transform.scale(self.background, self.background_size)
+        # loaded in the background, the scene is shown without it until then
+        self.background = self.controller.resource_loader.get_loaded_image(
+            "screen_loading"
+        )
 
     def on_exit(self):
         self.log("Exiting scene.")
@@ -36,20 +39,85 @@ class IntroScene(Scene):
         self.zoom_factor = 1.0
         self.time_elapsed = 0.0
 
+    def is_animating(self) -> bool:
+        return True
+
+    def draw_zoom(self, screen: pyg.Surface) -> None:
+        """
+        Draw the background zoomed by the current zoom factor, centered on the screen.
+
+        Instead of scaling the whole background to an ever-growing surface,
+        only the area of the background that is visible on the screen is
+        scaled, straight into the screen, so no new surfaces are allocated
+        and the cost of a frame does not grow with the zoom.
+
+        Args:
+            screen (pyg.Surface): The screen to render the background on.
+        """
+        screen_rect = screen.get_rect()
+        background_rect = self.background.get_rect()
+        # area of the background that would cover the whole screen, rounded
+        # up so scaling it never leaves a gap at the right or bottom edge
+        source_rect = pyg.Rect(
+            0,
+            0,
+            math.ceil(screen_rect.width / self.zoom_factor),
+            math.ceil(screen_rect.height / self.zoom_factor),
+        )
+        source_rect.center = background_rect.center
+        visible_rect = source_rect.clip(background_rect)
+        if visible_rect == source_rect:
+            pyg.transform.scale(
+                self.background.subsurface(visible_rect), screen_rect.size, screen
+            )
+            return
+
+        # the background doesn't cover the screen, the rest is left black
+        target_rect = pyg.Rect(
+            round((visible_rect.x - source_rect.x) * self.zoom_factor),
+            round((visible_rect.y - source_rect.y) * self.zoom_factor),
+            round(visible_rect.width * self.zoom_factor),
+            round(visible_rect.height * self.zoom_factor),
+        ).clip(screen_rect)
+        screen.fill(Colors.BLACK)
+        pyg.transform.scale(
+            self.background.subsurface(visible_rect),
+            target_rect.size,
+            screen.subsurface(target_rect),
+        )
+
+    def draw_progress(self, screen: pyg.Surface) -> None:
+        """
+        Draw a progress bar with the loading progress of the resources.
+
+        Args:
+            screen (pyg.Surface): The screen to render the progress bar on.
+        """
+        bar = pyg.Rect(0, 0, screen.get_width() // 2, 8)
+        bar.midbottom = (screen.get_width() // 2, screen.get_height() - 40)
+        progress = self.controller.resource_loader.progress
+        pyg.draw.rect(screen, Colors.BLACK, bar)
+        pyg.draw.rect(
+            screen, Colors.LIGHT_BLUE, (bar.x, bar.y, int(bar.width * progress), bar.h)
+        )
+        pyg.draw.rect(screen, Colors.WHITE, bar, 1)
+
     def update(self, screen: pyg.Surface, delta_time: float) -> None:
         self.time_elapsed += delta_time
         self.zoom_factor += self.zoom_speed * delta_time
+        if self.background is None:
+            self.background = self.controller.resource_loader.get_loaded_image(
+                "screen_loading"
+            )
+        if self.background is None:
+            screen.fill(Colors.BLACK)
+        else:
+            self.draw_zoom(screen)
+        self.draw_progress(screen)
 
-        new_width = int(self.background.get_width() * self.zoom_factor)
-        new_height = int(self.background.get_height() * self.zoom_factor)
-        zoomed_background = pyg.transform.scale(
-            self.background, (new_width, new_height)
-        )
-        x = (screen.get_width() - new_width) // 2
-        y = (screen.get_height() - new_height) // 2
-        screen.blit(zoomed_background, (x, y))
-
-        if self.time_elapsed > self.max_time:
+        # the next scenes need the resources, so wait for them to load
+        loading = self.controller.resource_loader.loading
+        if self.time_elapsed > self.max_time and not loading:
             self.controller.change_scene("main_menu")
 
     def handle_event(self, event: pyg.event.Event) -> None: ...
@@ -41,13 +41,20 @@ class LanguageSettingsScene(Scene):
         element_y = offset_y + index * (element_height + 10)
         return element_x, element_y
 
-    def add_button(self, name: str, text: str, action, index: int, offset_y: int = 0):
+    def add_button(
+        self,
+        name: str,
+        text_key: tuple[str, str],
+        action,
+        index: int,
+        offset_y: int = 0,
+    ):
         """
         Add a button to the scene.
 
         Args:
             name (str): The name of the button.
-            text (str): The text of the button.
+            text_key (tuple[str, str]): The localization section and key of the text.
             action (callable): The action to perform when the button is clicked.
             index (int): The index of the button.
             offset_y (int): The vertical offset for the initial position.
@@ -59,8 +66,8 @@ class LanguageSettingsScene(Scene):
         button = Button(
             scene=self,
             name=name,
-            text=text,
-            font=pyg.font.Font(None, 24),
+            text=self.translate(*text_key),
+            font=self.controller.resource_loader.get_font(size=24),
             font_size=24,
             font_color=Colors.WHITE,
             action=action,
@@ -69,6 +76,7 @@ class LanguageSettingsScene(Scene):
             color=Colors.BLUE,
             debug=self.debug,
         )
+        self.localized[button] = text_key
         self.buttons.append(button)
 
     def add_element(self, element, index: int, offset_y: int = 0):
@@ -97,13 +105,10 @@ class LanguageSettingsScene(Scene):
         self.controller.set_language(language)
         self.controller.change_scene(self.name)
 
-    def on_enter(self):
-        self.log("Entering scene.")
-
-        lang = self.controller.lang
-        lang_settings = self.controller.localizations.get_key("music_settings", lang)
-        glob = self.controller.localizations.get_key("global", lang)
-
+    def build(self):
+        """
+        Build the components of the scene.
+        """
         offset_y = 100
 
         # adding elements
@@ -116,7 +121,7 @@ class LanguageSettingsScene(Scene):
                 action=self.change_language,
                 selected_key=self.controller.lang,
                 position=(0, 0),
-                font=pyg.font.Font(None, 24),
+                font=self.controller.resource_loader.get_font(size=24),
                 color=Colors.BLUE,
                 item_color=Colors.BLACK,
                 selected_color=Colors.BLUE,
@@ -128,26 +133,23 @@ class LanguageSettingsScene(Scene):
 
         self.add_button(
             "back_btn",
-            glob["back"],
+            ("global", "back"),
             lambda: self.controller.change_scene("settings_scene"),
             4,
         )
 
+    def get_components(self) -> list:
+        return [*self.buttons, *self.elements]
+
+    def on_enter(self):
+        self.log("Entering scene.")
+
     def on_exit(self):
         self.log("Exiting scene.")
         self.background = None
-        self.buttons.clear()
-        self.elements.clear()
 
     def handle_event(self, event: list[pyg.event.Event]) -> None:
-        for button in self.buttons:
-            button.handle_event(event)
-        for element in self.elements:
-            element.handle_event(event)
-
-    def update(self, screen: pyg.Surface, delta_time: float) -> None:
-        screen.fill(Colors.BLACK)
-        for button in self.buttons:
-            button.draw(screen)
-        for element in self.elements:
-            element.draw(screen)
+        self.dispatch_event(event)
+
+    def update(self, screen: pyg.Surface, delta_time: float) -> list[pyg.Rect] | None:
+        return self.draw_components(screen, self.get_components())
@@ -4,7 +4,7 @@ Main menu scene.
 
 import pygame as pyg
 from ..scene import Scene
-from ..constants import Colors, DisplayConfig
+from ..constants import Colors, DisplayConfig, ResourceConfig
 from ..components import Button
 from ..components import Image
 
@@ -45,13 +45,13 @@ class MainMenuScene(Scene):
         )
         return btn_x, btn_y
 
-    def add_button(self, name: str, text: str, action, index: int):
+    def add_button(self, name: str, text_key: tuple[str, str], action, index: int):
         """
         Add a button to the scene.
 
         Args:
             name (str): The name of the button.
-            text (str): The text of the button.
+            text_key (tuple[str, str]): The localization section and key of the text.
             action (callable): The action to perform when the button is clicked.
             index (int): The index of the button.
         """
@@ -60,8 +60,8 @@ class MainMenuScene(Scene):
         button = Button(
             scene=self,
             name=name,
-            text=text,
-            font=pyg.font.Font(None, 24),
+            text=self.translate(*text_key),
+            font=self.controller.resource_loader.get_font(size=24),
             font_size=24,
             font_color=Colors.WHITE,
             action=action,
@@ -70,56 +70,58 @@ class MainMenuScene(Scene):
             color=Colors.BLUE,
             debug=self.debug,
         )
+        self.localized[button] = text_key
         self.buttons.append(button)
 
-    def on_enter(self):
+    def build(self):
         """
-        Called when the scene is entered.
+        Build the logo and the buttons of the scene.
         """
-        self.log("Entering scene.")
-        lang = self.controller.lang
-        menu = self.controller.localizations.get_key("menu", lang)
-
+        logo_size = ResourceConfig.IMAGE_SIZES["logo"]
         self.logo = Image(
-            image=self.controller.resource_loader.images["logo"],
+            image=self.controller.resource_loader.get_scaled_image("logo", logo_size),
             scene=self,
             name="logo",
             position=(DisplayConfig.WIDTH // 4, 50),
-            size=(DisplayConfig.WIDTH // 2, 200),
+            size=logo_size,
             debug=self.debug,
         )
 
         # adding buttons
         self.add_button(
             "play_btn",
-            menu["play"],
+            ("menu", "play"),
             lambda: self.controller.change_scene("play_scene"),
             0,
         )
         self.add_button(
             "multiplayer_btn",
-            menu["multiplayer"],
+            ("menu", "multiplayer"),
             lambda: self.controller.change_scene("multiplayer_menu_scene"),
             1,
         )
         self.add_button(
             "settings_btn",
-            menu["settings"],
+            ("menu", "settings"),
             lambda: self.controller.change_scene("settings_scene"),
             2,
         )
-        self.add_button("exit_btn", menu["exit"], lambda: self.controller.stop(), 3)
+        self.add_button("exit_btn", ("menu", "exit"), lambda: self.controller.stop(), 3)
+
+    def get_components(self) -> list:
+        return [*self.buttons, self.logo]
+
+    def on_enter(self):
+        """
+        Called when the scene is entered.
+        """
+        self.log("Entering scene.")
 
     def on_exit(self):
         self.log("Exiting scene.")
-        self.buttons.clear()
 
-    def update(self, screen: pyg.Surface, delta_time: float) -> None:
-        screen.fill(Colors.BLACK)
-        for button in self.buttons:
-            button.draw(screen)
-        self.logo.draw(screen)
+    def update(self, screen: pyg.Surface, delta_time: float) -> list[pyg.Rect] | None:
+        return self.draw_components(screen, self.get_components())
 
     def handle_event(self, event: pyg.event.Event) -> None:
-        for button in self.buttons:
-            button.handle_event(event)
+        self.dispatch_event(event)
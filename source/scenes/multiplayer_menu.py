@@ -40,13 +40,20 @@ class MultiplayerMenuScene(Scene):
         btn_y = offset_y + index * (button_height + 10)
         return btn_x, btn_y
 
-    def add_button(self, name: str, text: str, action, index: int, offset_y: int = 0):
+    def add_button(
+        self,
+        name: str,
+        text_key: tuple[str, str],
+        action,
+        index: int,
+        offset_y: int = 0,
+    ):
         """
         Add a button to the scene.
 
         Args:
             name (str): The name of the button.
-            text (str): The text of the button.
+            text_key (tuple[str, str]): The localization section and key of the text.
             action (callable): The action to perform when the button is clicked.
             index (int): The index of the button.
             offset_y (int): The vertical offset for the initial position.
@@ -58,8 +65,8 @@ class MultiplayerMenuScene(Scene):
         button = Button(
             scene=self,
             name=name,
-            text=text,
-            font=pyg.font.Font(None, 24),
+            text=self.translate(*text_key),
+            font=self.controller.resource_loader.get_font(size=24),
             font_size=24,
             font_color=Colors.WHITE,
             action=action,
@@ -68,49 +75,49 @@ class MultiplayerMenuScene(Scene):
             color=Colors.BLUE,
             debug=self.debug,
         )
+        self.localized[button] = text_key
         self.buttons.append(button)
 
-    def on_enter(self):
-        self.log("Entering scene.")
-
-        lang = self.controller.lang
-        multi_settings = self.controller.localizations.get_key("multiplayer_menu", lang)
-        glob = self.controller.localizations.get_key("global", lang)
-
+    def build(self):
+        """
+        Build the components of the scene.
+        """
         offset_y = 100
         state = self.controller.music.paused
         self.add_button(
             "create_room_btn",
-            multi_settings["create"],
+            ("multiplayer_menu", "create"),
             lambda: self.controller.change_scene("create_room_scene"),
             0,
             offset_y,
         )
         self.add_button(
             "join_room_btn",
-            multi_settings["join"],
+            ("multiplayer_menu", "join"),
             lambda: self.controller.change_scene("join_room_scene"),
             1,
             offset_y,
         )
         self.add_button(
             "back_btn",
-            glob["back"],
+            ("global", "back"),
             lambda: self.controller.change_scene("main_menu"),
             4,
             offset_y,
         )
 
+    def get_components(self) -> list:
+        return self.buttons
+
+    def on_enter(self):
+        self.log("Entering scene.")
+
     def on_exit(self):
         self.log("Exiting scene.")
         self.background = None
-        self.buttons.clear()
 
     def handle_event(self, event: list[pyg.event.Event]) -> None:
-        for button in self.buttons:
-            button.handle_event(event)
+        self.dispatch_event(event)
 
-    def update(self, screen: pyg.Surface, delta_time: float) -> None:
-        screen.fill(Colors.BLACK)
-        for button in self.buttons:
-            button.draw(screen)
+    def update(self, screen: pyg.Surface, delta_time: float) -> list[pyg.Rect] | None:
+        return self.draw_components(screen, self.get_components())
@@ -40,13 +40,20 @@ class SettingsMenuScene(Scene):
         btn_y = offset_y + index * (button_height + 10)
         return btn_x, btn_y
 
-    def add_button(self, name: str, text: str, action, index: int, offset_y: int = 0):
+    def add_button(
+        self,
+        name: str,
+        text_key: tuple[str, str],
+        action,
+        index: int,
+        offset_y: int = 0,
+    ):
         """
         Add a button to the scene.
 
         Args:
             name (str): The name of the button.
-            text (str): The text of the button.
+            text_key (tuple[str, str]): The localization section and key of the text.
             action (callable): The action to perform when the button is clicked.
             index (int): The index of the button.
             offset_y (int): The vertical offset for the initial position.
@@ -58,8 +65,8 @@ class SettingsMenuScene(Scene):
         button = Button(
             scene=self,
             name=name,
-            text=text,
-            font=pyg.font.Font(None, 24),
+            text=self.translate(*text_key),
+            font=self.controller.resource_loader.get_font(size=24),
             font_size=24,
             font_color=Colors.WHITE,
             action=action,
@@ -68,48 +75,49 @@ class SettingsMenuScene(Scene):
             color=Colors.BLUE,
             debug=self.debug,
         )
+        self.localized[button] = text_key
         self.buttons.append(button)
 
-    def on_enter(self):
-        self.log("Entering scene.")
-        lang = self.controller.lang
-        settings_menu = self.controller.localizations.get_key("settings", lang)
-        glob = self.controller.localizations.get_key("global", lang)
-
+    def build(self):
+        """
+        Build the components of the scene.
+        """
         # adding buttons with an offset of 100 pixels from the top
         offset_y = 100
         self.add_button(
             "language_btn",
-            settings_menu["language"],
+            ("settings", "language"),
             lambda: self.controller.change_scene("language_settings_scene"),
             0,
             offset_y,
         )
         self.add_button(
             "music_btn",
-            settings_menu["music"],
+            ("settings", "music"),
             lambda: self.controller.change_scene("music_settings_scene"),
             1,
             offset_y,
         )
         self.add_button(
             "back_btn",
-            glob["back"],
+            ("global", "back"),
             lambda: self.controller.change_scene("main_menu"),
             2,
             offset_y,
         )
 
+    def get_components(self) -> list:
+        return self.buttons
+
+    def on_enter(self):
+        self.log("Entering scene.")
+
     def on_exit(self):
         self.log("Exiting scene.")
         self.background = None
-        self.buttons.clear()
 
     def handle_event(self, event: list[pyg.event.Event]) -> None:
-        for button in self.buttons:
-            button.handle_event(event)
+        self.dispatch_event(event)
 
-    def update(self, screen: pyg.Surface, delta_time: float) -> None:
-        screen.fill(Colors.BLACK)
-        for button in self.buttons:
-            button.draw(screen)
+    def update(self, screen: pyg.Surface, delta_time: float) -> list[pyg.Rect] | None:
+        return self.draw_components(screen, self.get_components())
@@ -0,0 +1,153 @@
+"""
+This module contains the SoundBank class, used to play the sound effects of the game.
+"""
+
+from collections import Counter
+import pygame as pyg
+from .logger import get_logger
+
+
+class SoundBank:
+    """
+    The sound effects of the game, decoded into `pyg.mixer.Sound` objects,
+    played on a fixed pool of reserved mixer channels.
+
+    When every channel is busy, a new effect takes the channel of the
+    lowest priority effect playing (the oldest among equals) if its own
+    priority is at least as high, or else it is dropped.
+    """
+
+    def __init__(self, channels: int, load: callable):
+        """
+        Create a new empty sound bank.
+
+        Args:
+            channels (int): The number of channels reserved for the effects.
+            load (callable): The function that decodes the sound of a path.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.channel_count: int = channels
+        self.load: callable = load
+        self.paths: dict[str, str] = {}
+        self.priorities: dict[str, int] = {}
+        self.sounds: dict[str, pyg.mixer.Sound] = {}
+        self.channels: list[pyg.mixer.Channel] = []
+        # the priority and start time of the effect of each channel
+        self.voice_priorities: list[int] = [0] * channels
+        self.voice_starts: list[int] = [0] * channels
+        self.plays: Counter = Counter()
+        self.drops: Counter = Counter()
+        self.steals: int = 0
+
+    def init(self) -> None:
+        """
+        Reserve the channels of the pool. Must be called after the mixer is initialized.
+        """
+        # the pool is added to the channels of the mixer, and reserved so
+        # they are never picked by Sound.play, only by the pool
+        pyg.mixer.set_num_channels(pyg.mixer.get_num_channels() + self.channel_count)
+        pyg.mixer.set_reserved(self.channel_count)
+        self.channels = [
+            pyg.mixer.Channel(index) for index in range(self.channel_count)
+        ]
+
+    def register(self, name: str, path: str, priority: int = 0) -> None:
+        """
+        Add an effect to the bank, without decoding it.
+
+        Args:
+            name (str): The name of the effect. Eg. "card_draw".
+            path (str): The path of the sound file.
+            priority (int): The priority of the effect, higher ones steal channels.
+        """
+        self.paths[name] = path
+        self.priorities[name] = priority
+
+    def get(self, name: str) -> pyg.mixer.Sound | None:
+        """
+        Get the sound of an effect, decoding it the first time.
+
+        Args:
+            name (str): The name of the effect.
+
+        Returns:
+            pyg.mixer.Sound | None: The sound, None if it can't be loaded.
+        """
+        sound = self.sounds.get(name)
+        if sound is None and name in self.paths:
+            try:
+                sound = self.load(self.paths[name])
+            except (FileNotFoundError, pyg.error) as exc:
+                self.logger.error(f"Error loading sound {name}: {exc}")
+                # not retried on every play
+                self.paths.pop(name)
+                return None
+            self.sounds[name] = sound
+        return sound
+
+    def preload(self) -> None:
+        """
+        Decode every effect registered.
+        """
+        for name in list(self.paths):
+            self.get(name)
+        self.logger.info(f"{len(self.sounds)} sounds loaded.")
+
+    def play(self, name: str, priority: int = None) -> bool:
+        """
+        Play an effect on a channel of the pool.
+
+        Args:
+            name (str): The name of the effect.
+            priority (int): The priority of this play, by default the one of the effect.
+
+        Returns:
+            bool: True if the effect is playing, False if it was dropped.
+        """
+        sound = self.get(name)
+        if sound is None or not self.channels:
+            self.drops[name] += 1
+            return False
+        if priority is None:
+            priority = self.priorities.get(name, 0)
+
+        chosen = None
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                chosen = index
+                break
+        if chosen is None:
+            chosen = min(
+                range(self.channel_count),
+                key=lambda index: (
+                    self.voice_priorities[index],
+                    self.voice_starts[index],
+                ),
+            )
+            if self.voice_priorities[chosen] > priority:
+                self.drops[name] += 1
+                return False
+            self.steals += 1
+
+        # playing on a busy channel stops its effect first
+        self.channels[chosen].play(sound)
+        self.voice_priorities[chosen] = priority
+        self.voice_starts[chosen] = pyg.time.get_ticks()
+        self.plays[name] += 1
+        return True
+
+    @property
+    def stats(self) -> dict:
+        """
+        Get the statistics of the bank, to tune the priorities and the pool size.
+
+        Returns:
+            dict: The plays and drops of each effect and the channels stolen.
+        """
+        return {
+            "channels": self.channel_count,
+            "sounds": len(self.sounds),
+            "plays": dict(self.plays),
+            "drops": dict(self.drops),
+            "steals": self.steals,
+        }
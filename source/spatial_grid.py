@@ -0,0 +1,64 @@
+"""
+This module contains the SpatialGrid class, used to find the components under a point.
+"""
+
+import pygame as pyg
+from .constants import DisplayConfig
+
+
+class SpatialGrid:
+    """
+    A uniform grid over the screen that indexes items by the cells their
+    rect overlaps, so the items under a point can be found without testing
+    every item.
+    """
+
+    def __init__(self, cell_size: int = DisplayConfig.GRID_CELL_SIZE):
+        """
+        Create a new empty grid.
+
+        Args:
+            cell_size (int): The width and height of each cell in pixels.
+        """
+        self.cell_size: int = cell_size
+        self.cells: dict[tuple[int, int], list[tuple[object, pyg.Rect]]] = {}
+
+    def insert(self, item: object, rect: pyg.Rect) -> None:
+        """
+        Add an item to every cell its rect overlaps.
+
+        Args:
+            item (object): The item to add.
+            rect (pyg.Rect): The area covered by the item.
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        rect = pyg.Rect(rect)
+        for column in range(
+            rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1
+        ):
+            for row in range(
+                rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1
+            ):
+                self.cells.setdefault((column, row), []).append((item, rect))
+
+    def query(self, point: tuple[int, int]) -> list:
+        """
+        Get the items whose rect contains a point.
+
+        Args:
+            point (tuple[int, int]): The point to test.
+
+        Returns:
+            list: The items under the point, in insertion order.
+        """
+        cell = (point[0] // self.cell_size, point[1] // self.cell_size)
+        return [
+            item for item, rect in self.cells.get(cell, ()) if rect.collidepoint(point)
+        ]
+
+    def clear(self) -> None:
+        """
+        Remove every item from the grid.
+        """
+        self.cells.clear()
@@ -0,0 +1,163 @@
+"""
+This module contains the SpriteAtlas class, used to pack the card images into a few large surfaces.
+"""
+
+from collections.abc import Hashable
+import pygame as pyg
+from .logger import get_logger
+from .surface_cache import SurfaceCache
+
+
+class SpriteAtlas:
+    """
+    A set of large surfaces (pages) holding many small images, each one at
+    one or more sizes, with an index of the rect of every image.
+
+    Images are packed in shelves: rows of images sorted by height, opening a
+    new row when the current one is full and a new page when the current one
+    is. Images are handed out as subsurfaces of the pages.
+    """
+
+    def __init__(self, page_size: tuple[int, int] = (1024, 1024), padding: int = 1):
+        """
+        Create a new empty atlas.
+
+        Args:
+            page_size (tuple[int, int]): The maximum width and height of each page.
+            padding (int): The space in pixels between images, so filtering
+                one never reads the pixels of its neighbours.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.page_size: tuple[int, int] = page_size
+        self.padding: int = padding
+        self.pages: list[pyg.Surface] = []
+        self.index: dict[tuple[Hashable, tuple[int, int]], tuple[int, pyg.Rect]] = {}
+        self.native_sizes: dict[Hashable, tuple[int, int]] = {}
+        self.sprites: dict[tuple[Hashable, tuple[int, int]], pyg.Surface] = {}
+
+    def build(
+        self, images: dict[Hashable, pyg.Surface], sizes: list[tuple[int, int]] = ()
+    ) -> None:
+        """
+        Pack images into the atlas, replacing its contents.
+
+        Args:
+            images (dict[Hashable, pyg.Surface]): The image of each id.
+            sizes (list[tuple[int, int]]): The sizes every image is also
+                scaled to, besides its own.
+
+        Raises:
+            ValueError: If an image doesn't fit in a page.
+        """
+        self.pages.clear()
+        self.index.clear()
+        self.sprites.clear()
+        self.native_sizes = {key: image.get_size() for key, image in images.items()}
+        variants = {}
+        for key, image in images.items():
+            variants[(key, image.get_size())] = image
+            for size in sizes:
+                size = tuple(size)
+                # skips the native size and the sizes listed twice
+                if (key, size) not in variants:
+                    variants[(key, size)] = pyg.transform.smoothscale(image, size)
+
+        placements = self.pack(
+            {key: image.get_size() for key, image in variants.items()}
+        )
+        page_bounds = {}
+        for page, rect in placements.values():
+            width, height = page_bounds.get(page, (0, 0))
+            page_bounds[page] = (max(width, rect.right), max(height, rect.bottom))
+        for page in range(len(page_bounds)):
+            # pages are trimmed to the area used, they are at most page_size
+            surface = pyg.Surface(page_bounds[page], pyg.SRCALPHA)
+            # the display format, when there is a display to convert to
+            if pyg.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            surface.fill((0, 0, 0, 0))
+            self.pages.append(surface)
+
+        for key, (page, rect) in placements.items():
+            # a max blend onto the transparent page copies the pixels as they
+            # are, alpha included, instead of blending them
+            self.pages[page].blit(variants[key], rect, special_flags=pyg.BLEND_RGBA_MAX)
+            self.index[key] = (page, rect)
+        stats = self.stats
+        self.logger.info(
+            f"Packed {stats['sprites']} sprites into {stats['pages']} pages "
+            f"({stats['occupancy']:.0%} occupancy)."
+        )
+
+    def pack(
+        self, sizes: dict[tuple[Hashable, tuple[int, int]], tuple[int, int]]
+    ) -> dict[tuple[Hashable, tuple[int, int]], tuple[int, pyg.Rect]]:
+        """
+        Find the page and rect of every image.
+
+        Args:
+            sizes (dict): The size of each image to pack.
+
+        Returns:
+            dict: The page and rect of each image.
+        """
+        page_width, page_height = self.page_size
+        placements = {}
+        page, x, y, shelf_height = 0, 0, 0, 0
+        for key in sorted(sizes, key=lambda key: sizes[key][1], reverse=True):
+            width, height = sizes[key]
+            if width > page_width or height > page_height:
+                msg = f"{key[0]} ({width}x{height}) doesn't fit in a page."
+                self.logger.error(msg)
+                raise ValueError(msg)
+            if x + width > page_width:
+                x, y, shelf_height = 0, y + shelf_height, 0
+            if y + height > page_height:
+                page, x, y, shelf_height = page + 1, 0, 0, 0
+            placements[key] = (page, pyg.Rect(x, y, width, height))
+            x += width + self.padding
+            shelf_height = max(shelf_height, height + self.padding)
+        return placements
+
+    def get(self, key: Hashable, size: tuple[int, int] = None) -> pyg.Surface:
+        """
+        Get an image of the atlas, as a subsurface of its page.
+
+        Args:
+            key (Hashable): The id of the image. Eg. the id of a planet.
+            size (tuple[int, int]): One of the sizes of the image, None for its own.
+
+        Returns:
+            pyg.Surface: The image. Drawing on it draws on the page.
+
+        Raises:
+            KeyError: If the atlas doesn't have the image at that size.
+        """
+        entry = (key, tuple(size) if size else self.native_sizes[key])
+        sprite = self.sprites.get(entry)
+        if sprite is None:
+            page, rect = self.index[entry]
+            sprite = self.pages[page].subsurface(rect)
+            self.sprites[entry] = sprite
+        return sprite
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.native_sizes
+
+    @property
+    def stats(self) -> dict:
+        """
+        Get the statistics of the atlas.
+
+        Returns:
+            dict: The number of pages and sprites, the bytes of the pages and
+                the fraction of their area used by sprites.
+        """
+        page_area = sum(page.get_width() * page.get_height() for page in self.pages)
+        used_area = sum(rect.width * rect.height for _, rect in self.index.values())
+        return {
+            "pages": len(self.pages),
+            "sprites": len(self.index),
+            "resident_bytes": sum(map(SurfaceCache.surface_size, self.pages)),
+            "occupancy": used_area / page_area if page_area else 0.0,
+        }
@@ -0,0 +1,89 @@
+"""
+This module contains the StartupProfiler class, used to measure where the time before the first frame goes.
+"""
+
+from contextlib import contextmanager
+from time import perf_counter
+from .logger import get_logger
+
+
+class StartupProfiler:
+    """
+    Records the wall time of the steps of the startup, grouped in
+    categories (imports, steps of Controller.set, scene constructors...),
+    and the time from the start of the process to the first frame.
+
+    Steps recorded after the first frame, like the constructors of the
+    scenes created on their first visit, are logged one by one as they end.
+    """
+
+    def __init__(self, origin: float = None, enabled: bool = False):
+        """
+        Create a new profiler.
+
+        Args:
+            origin (float): The `perf_counter` time the startup began at,
+                by default now.
+            enabled (bool): Whether to log the report once the first frame is
+                shown, and the steps recorded after it.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.origin: float = perf_counter() if origin is None else origin
+        self.enabled: bool = enabled
+        self.timings: dict[str, dict[str, float]] = {}
+        self.first_frame: float = None
+
+    def record(self, category: str, name: str, seconds: float) -> None:
+        """
+        Record the time of a step.
+
+        Args:
+            category (str): The category of the step. Eg. "set".
+            name (str): The name of the step. Eg. "fonts".
+            seconds (float): The wall time of the step.
+        """
+        self.timings.setdefault(category, {})[name] = seconds
+        if self.enabled and self.first_frame is not None:
+            self.logger.info(f"Startup step {category}/{name}: {seconds * 1000:.2f} ms")
+
+    @contextmanager
+    def step(self, category: str, name: str):
+        """
+        Record the time spent in the body of a `with` statement.
+
+        Args:
+            category (str): The category of the step.
+            name (str): The name of the step.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, perf_counter() - start)
+
+    def finish(self) -> None:
+        """
+        Record the time to the first frame, only the first time it is called,
+        and log the report if enabled.
+        """
+        if self.first_frame is not None:
+            return
+        self.first_frame = perf_counter() - self.origin
+        if self.enabled:
+            self.logger.info(self.report())
+
+    def report(self) -> str:
+        """
+        Get a report of the recorded timings, in milliseconds.
+
+        Returns:
+            str: One line per step, under the total of its category.
+        """
+        lines = ["Startup profile (ms):"]
+        for category, steps in self.timings.items():
+            lines.append(f"{category:<40}{sum(steps.values()) * 1000:>10.2f}")
+            for name, seconds in steps.items():
+                lines.append(f"  {name:<38}{seconds * 1000:>10.2f}")
+        if self.first_frame is not None:
+            lines.append(f"{'time to first frame':<40}{self.first_frame * 1000:>10.2f}")
+        return "\n".join(lines)
@@ -0,0 +1,140 @@
+"""
+This module contains the classes used to load images on demand with a bounded memory footprint.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+import pygame as pyg
+from .logger import get_logger
+
+
+class SurfaceCache:
+    """
+    A cache of surfaces loaded on first access, keyed by file path, and
+    by size for the images scaled when they are loaded.
+
+    The size in bytes of every surface is tracked, and the least recently
+    used surfaces are evicted once the memory budget is exceeded.
+    """
+
+    def __init__(self, budget: int, load: callable):
+        """
+        Create a new surface cache.
+
+        Args:
+            budget (int): The maximum number of bytes of the surfaces kept.
+            load (callable): The function that loads the surface of a path,
+                scaled to a size unless the size is None.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.budget: int = budget
+        self.load: callable = load
+        self.surfaces: OrderedDict[str | tuple[str, tuple[int, int]], pyg.Surface] = (
+            OrderedDict()
+        )
+        self.resident_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @staticmethod
+    def surface_size(surface: pyg.Surface) -> int:
+        """
+        Get the number of bytes used by the pixels of a surface.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def get(self, path: str, size: tuple[int, int] = None) -> pyg.Surface:
+        """
+        Get the surface of a path, loading it if it isn't in the cache.
+
+        Args:
+            path (str): The path of the image.
+            size (tuple[int, int]): The size to scale the image to, None to keep it.
+
+        Returns:
+            pyg.Surface: The surface.
+        """
+        key = path if size is None else (path, tuple(size))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.load(path, size)
+        self.surfaces[key] = surface
+        self.resident_bytes += self.surface_size(surface)
+        self.evict()
+        return surface
+
+    def evict(self) -> None:
+        """
+        Evict the least recently used surfaces until the budget is respected.
+        The most recently used surface is always kept.
+        """
+        while self.resident_bytes > self.budget and len(self.surfaces) > 1:
+            key, surface = self.surfaces.popitem(last=False)
+            self.resident_bytes -= self.surface_size(surface)
+            self.evictions += 1
+            self.logger.debug(f"Evicted {key}.", console=False)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Get the statistics of the cache.
+
+        Returns:
+            dict: The resident surfaces and bytes, budget, hits, misses and evictions.
+        """
+        return {
+            "surfaces": len(self.surfaces),
+            "resident_bytes": self.resident_bytes,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        """
+        Remove every surface from the cache.
+        """
+        self.surfaces.clear()
+        self.resident_bytes = 0
+
+
+class LazySurfaces(Mapping):
+    """
+    A read-only mapping of names to surfaces, loaded through a surface cache
+    on access. Used in place of a dict of loaded surfaces.
+    """
+
+    def __init__(self, cache: SurfaceCache, paths: dict):
+        """
+        Create a new mapping.
+
+        Args:
+            cache (SurfaceCache): The cache the surfaces are loaded through.
+            paths (dict): The path of the image of each name.
+        """
+        self.cache: SurfaceCache = cache
+        self.paths: dict = paths
+
+    def __getitem__(self, key) -> pyg.Surface:
+        path = self.paths[key]
+        try:
+            return self.cache.get(path)
+        except (FileNotFoundError, pyg.error) as exc:
+            self.cache.logger.error(f"Error loading image {key} from {path}.")
+            raise KeyError(key) from exc
+
+    def __contains__(self, key) -> bool:
+        # without loading the surface, unlike the default implementation
+        return key in self.paths
+
+    def __iter__(self) -> Iterator:
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
@@ -0,0 +1,15 @@
+"""
+Shared setup of the tests: the project root is importable, and the files
+the game writes to the working directory (app.log) go to a temporary one.
+"""
+
+import os
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# before the modules are imported, the log file is opened with the first logger
+os.chdir(tempfile.mkdtemp(prefix="universe-catch-tests-"))
@@ -0,0 +1,62 @@
+import os
+import pytest
+from source.asset_bundle import AssetBundle, pack
+from source.constants import ResourceConfig
+from source.resource_loader import ResourceLoader
+
+
+@pytest.fixture
+def resources(tmp_path):
+    directory = tmp_path / "resources"
+    (directory / "planets").mkdir(parents=True)
+    (directory / "logo.png").write_bytes(b"logo")
+    (directory / "planets" / "earth.png").write_bytes(b"earth" * 10)
+    return directory
+
+
+def test_pack_and_read(resources, tmp_path):
+    filename = str(tmp_path / "resources.bundle")
+    index = pack(str(resources), filename)
+    assert set(index) == {"logo.png", "planets/earth.png"}
+    bundle = AssetBundle(filename)
+    assert bytes(bundle.get("planets/earth.png")) == b"earth" * 10
+    assert "logo.png" in bundle and "missing.png" not in bundle
+    assert bundle.verify("logo.png")
+
+
+def test_pack_is_deterministic(resources, tmp_path):
+    first, second = tmp_path / "first.bundle", tmp_path / "second.bundle"
+    pack(str(resources), str(first))
+    pack(str(resources), str(second))
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_loose_files_newer_than_the_bundle_are_outdated(resources, tmp_path):
+    filename = str(tmp_path / "resources.bundle")
+    pack(str(resources), filename)
+    bundle = AssetBundle(filename)
+    logo = str(resources / "logo.png")
+    os.utime(logo, ns=(bundle.built - 10**9, bundle.built - 10**9))
+    assert not bundle.is_outdated(logo)
+    os.utime(logo, ns=(bundle.built + 10**9, bundle.built + 10**9))
+    assert bundle.is_outdated(logo)
+    assert not bundle.is_outdated(str(resources / "missing.png"))
+
+
+@pytest.mark.parametrize("cut", [0, 3, 20, -5])
+def test_invalid_bundles_are_rejected(resources, tmp_path, cut):
+    filename = tmp_path / "resources.bundle"
+    pack(str(resources), str(filename))
+    data = filename.read_bytes()
+    filename.write_bytes(data[:cut] if cut else b"not a bundle")
+    with pytest.raises(ValueError):
+        AssetBundle(str(filename))
+
+
+def test_loader_falls_back_to_loose_files(resources, tmp_path, monkeypatch):
+    filename = tmp_path / "resources.bundle"
+    filename.write_bytes(b"")
+    monkeypatch.setattr(ResourceConfig, "BUNDLE_FILE", str(filename))
+    loader = ResourceLoader(str(resources))
+    assert loader.bundle is None
+    assert loader.read_resource(str(resources / "logo.png"))[1] == b"logo"
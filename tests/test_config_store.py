@@ -0,0 +1,64 @@
+import json
+import time
+import pytest
+from source.config_store import ConfigStore
+
+SCHEMA = {"lang": (str, "en"), "music_volume": (float, 1.0)}
+
+
+def test_defaults_and_validation(tmp_path):
+    store = ConfigStore(str(tmp_path / "config.json"), SCHEMA, delay=0.01)
+    assert store.get("lang") == "en"
+    with pytest.raises(ValueError):
+        store.set("music_volume", "loud")
+    with pytest.raises(ValueError):
+        store.set("lang", 3)
+    with pytest.raises(KeyError):
+        store.set("unknown", 1)
+
+
+def test_load_keeps_defaults_for_invalid_values(tmp_path):
+    filename = tmp_path / "config.json"
+    filename.write_text(json.dumps({"lang": 5, "music_volume": "0.5", "extra": 1}))
+    store = ConfigStore(str(filename), SCHEMA)
+    store.load()
+    assert store.get("lang") == "en"
+    assert store.get("music_volume") == 0.5
+    assert store.values["extra"] == 1
+
+
+def test_changes_are_saved_once_they_stop(tmp_path):
+    filename = tmp_path / "config.json"
+    store = ConfigStore(str(filename), SCHEMA, delay=0.05)
+    store.set("lang", "es")
+    store.set("music_volume", 0.5)
+    assert not filename.exists()
+    time.sleep(0.3)
+    assert json.loads(filename.read_text()) == {"lang": "es", "music_volume": 0.5}
+    store.close()
+
+
+def test_close_saves_pending_changes(tmp_path):
+    filename = tmp_path / "config.json"
+    store = ConfigStore(str(filename), SCHEMA, delay=60)
+    store.set("lang", "es")
+    store.close()
+    assert json.loads(filename.read_text())["lang"] == "es"
+
+
+def test_failed_saves_back_off(tmp_path):
+    directory = tmp_path / "missing"
+    store = ConfigStore(str(directory / "config.json"), SCHEMA, delay=0.01)
+    attempts = []
+    flush = store.flush
+    store.flush = lambda: (attempts.append(1), flush())
+    store.set("lang", "es")
+    time.sleep(0.5)
+    # 0.01 s doubled after each failure, instead of a retry in a busy loop
+    assert 2 <= len(attempts) <= 8
+    assert store.dirty
+
+    directory.mkdir()
+    store.close()
+    assert json.loads((directory / "config.json").read_text())["lang"] == "es"
+    assert store.failures == 0
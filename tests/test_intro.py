@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+import pygame as pyg
+import pytest
+from source.constants import Colors
+from source.scenes import IntroScene
+
+
+@pytest.fixture
+def scene() -> IntroScene:
+    scene = IntroScene(SimpleNamespace(debug=False))
+    scene.background = pyg.Surface((1000, 600))
+    scene.background.fill(Colors.WHITE)
+    return scene
+
+
+def test_zoom_always_covers_the_screen(scene):
+    screen = pyg.Surface((800, 600))
+    for step in range(181):
+        scene.zoom_factor = 1.0 + step * 0.005
+        screen.fill(Colors.BLACK)
+        scene.draw_zoom(screen)
+        # a background with a single color covers every pixel of the screen
+        assert pyg.mask.from_threshold(
+            screen, Colors.WHITE, (1, 1, 1, 255)
+        ).count() == (800 * 600), scene.zoom_factor
+
+
+def test_zoom_out_leaves_the_rest_black(scene):
+    screen = pyg.Surface((800, 600))
+    screen.fill(Colors.WHITE)
+    scene.zoom_factor = 0.5
+    scene.draw_zoom(screen)
+    assert screen.get_at((0, 0)) == Colors.BLACK
+    assert screen.get_at((400, 300)) == Colors.WHITE
@@ -0,0 +1,31 @@
+import pygame as pyg
+from source.spatial_grid import SpatialGrid
+
+
+def test_query_returns_items_under_point_in_order():
+    grid = SpatialGrid(cell_size=100)
+    grid.insert("back", pyg.Rect(0, 0, 300, 300))
+    grid.insert("button", pyg.Rect(150, 150, 50, 20))
+    assert grid.query((160, 160)) == ["back", "button"]
+    assert grid.query((10, 10)) == ["back"]
+    assert grid.query((350, 10)) == []
+
+
+def test_rect_edges_follow_pygame():
+    grid = SpatialGrid(cell_size=100)
+    # ends exactly on a cell border, so it only covers the first cell
+    grid.insert("item", pyg.Rect(0, 0, 100, 100))
+    assert list(grid.cells) == [(0, 0)]
+    assert grid.query((99, 99)) == ["item"]
+    assert grid.query((100, 50)) == []
+
+
+def test_items_spanning_cells_and_empty_rects():
+    grid = SpatialGrid(cell_size=100)
+    grid.insert("wide", pyg.Rect(50, 50, 200, 10))
+    grid.insert("empty", pyg.Rect(10, 10, 0, 5))
+    assert set(grid.cells) == {(0, 0), (1, 0), (2, 0)}
+    assert grid.query((240, 55)) == ["wide"]
+    assert grid.query((10, 10)) == []
+    grid.clear()
+    assert grid.query((60, 55)) == []
@@ -0,0 +1,52 @@
+import pygame as pyg
+import pytest
+from source.sprite_atlas import SpriteAtlas
+
+
+def overlaps(placements: dict) -> bool:
+    items = list(placements.values())
+    return any(
+        page == other_page and rect.colliderect(other_rect)
+        for index, (page, rect) in enumerate(items)
+        for other_page, other_rect in items[index + 1 :]
+    )
+
+
+def test_pack_places_every_image_without_overlaps():
+    atlas = SpriteAtlas(page_size=(100, 100), padding=1)
+    sizes = {(key, (30, 20 + key)): (30, 20 + key) for key in range(8)}
+    placements = atlas.pack(sizes)
+    assert set(placements) == set(sizes)
+    assert not overlaps(placements)
+    for page, rect in placements.values():
+        assert pyg.Rect(0, 0, 100, 100).contains(rect)
+        assert rect.size in sizes.values()
+
+
+def test_pack_opens_new_pages_when_full():
+    atlas = SpriteAtlas(page_size=(100, 100), padding=0)
+    sizes = {(key, (50, 50)): (50, 50) for key in range(5)}
+    placements = atlas.pack(sizes)
+    assert sorted(page for page, _ in placements.values()) == [0, 0, 0, 0, 1]
+    assert not overlaps(placements)
+
+
+def test_pack_rejects_images_larger_than_a_page():
+    atlas = SpriteAtlas(page_size=(100, 100))
+    with pytest.raises(ValueError):
+        atlas.pack({("big", (101, 10)): (101, 10)})
+
+
+def test_build_keeps_pixels_and_sizes():
+    pyg.display.init()
+    images = {}
+    for key, color in enumerate([(255, 0, 0, 255), (0, 255, 0, 128)]):
+        images[key] = pyg.Surface((20, 30), pyg.SRCALPHA)
+        images[key].fill(color)
+    atlas = SpriteAtlas(page_size=(64, 64))
+    atlas.build(images, [(10, 15), (10, 15), (20, 30)])
+    # the native size and the repeated size are packed once
+    assert atlas.stats["sprites"] == 4
+    for key, image in images.items():
+        assert atlas.get(key).get_at((5, 5)) == image.get_at((5, 5))
+        assert atlas.get(key, (10, 15)).get_size() == (10, 15)
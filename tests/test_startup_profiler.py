@@ -0,0 +1,42 @@
+from source.startup_profiler import StartupProfiler
+
+
+def make_profiler(enabled: bool, monkeypatch) -> tuple[StartupProfiler, list[str]]:
+    profiler = StartupProfiler(enabled=enabled)
+    messages = []
+    # the logger is shared, so it is restored after the test
+    monkeypatch.setattr(profiler.logger, "info", messages.append)
+    return profiler, messages
+
+
+def test_report_groups_steps_by_category():
+    profiler = StartupProfiler()
+    profiler.record("set", "fonts", 0.002)
+    profiler.record("set", "images", 0.003)
+    with profiler.step("scene", "intro"):
+        pass
+    profiler.finish()
+    report = profiler.report().splitlines()
+    assert report[0] == "Startup profile (ms):"
+    assert report[1].split() == ["set", "5.00"]
+    assert report[2].split() == ["fonts", "2.00"]
+    assert report[4].split()[0] == "scene"
+    assert report[-1].startswith("time to first frame")
+
+
+def test_steps_after_the_first_frame_are_logged(monkeypatch):
+    profiler, messages = make_profiler(True, monkeypatch)
+    profiler.record("scene", "intro", 0.001)
+    assert messages == []
+    profiler.finish()
+    assert len(messages) == 1 and "intro" in messages[0]
+    profiler.record("scene", "main_menu", 0.004)
+    assert messages[-1] == "Startup step scene/main_menu: 4.00 ms"
+    assert profiler.timings["scene"]["main_menu"] == 0.004
+
+
+def test_disabled_profiler_logs_nothing(monkeypatch):
+    profiler, messages = make_profiler(False, monkeypatch)
+    profiler.finish()
+    profiler.record("scene", "main_menu", 0.004)
+    assert messages == []
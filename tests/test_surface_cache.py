@@ -0,0 +1,43 @@
+import pygame as pyg
+from source.surface_cache import LazySurfaces, SurfaceCache
+
+
+def make_cache(budget: int, loads: list) -> SurfaceCache:
+    def load(path: str, size: tuple[int, int] = None) -> pyg.Surface:
+        loads.append((path, size))
+        return pyg.Surface(size or (10, 10), pyg.SRCALPHA)
+
+    return SurfaceCache(budget, load)
+
+
+def test_surfaces_are_loaded_once_per_path_and_size():
+    loads = []
+    cache = make_cache(10**6, loads)
+    assert cache.get("logo.png") is cache.get("logo.png")
+    scaled = cache.get("logo.png", (20, 5))
+    assert scaled.get_size() == (20, 5)
+    assert cache.get("logo.png", [20, 5]) is scaled
+    assert loads == [("logo.png", None), ("logo.png", (20, 5))]
+    assert cache.stats["resident_bytes"] == 10 * 10 * 4 + 20 * 5 * 4
+    assert (cache.stats["hits"], cache.stats["misses"]) == (2, 2)
+
+
+def test_least_recently_used_surfaces_are_evicted():
+    loads = []
+    # room for two 10x10 surfaces
+    cache = make_cache(800, loads)
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+    assert list(cache.surfaces) == ["a", "c"]
+    assert cache.stats["evictions"] == 1
+    assert cache.resident_bytes == 800
+
+
+def test_lazy_surfaces_load_on_access():
+    loads = []
+    images = LazySurfaces(make_cache(10**6, loads), {"logo": "logo.png"})
+    assert "logo" in images and not loads
+    assert images["logo"].get_size() == (10, 10)
+    assert loads == [("logo.png", None)]
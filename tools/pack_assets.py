@@ -0,0 +1,30 @@
+"""
+Pack the resources of the game into a single asset bundle.
+
+Usage (from the root of the project):
+    python tools/pack_assets.py resources resources.bundle
+"""
+
+import os
+import sys
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from source.asset_bundle import pack
+from source.constants import ResourceConfig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("resource_dir", nargs="?", default=ResourceConfig.RESOURCE_DIR)
+    parser.add_argument("bundle", nargs="?", default=ResourceConfig.BUNDLE_FILE)
+    args = parser.parse_args()
+    index = pack(args.resource_dir, args.bundle)
+    size = os.path.getsize(args.bundle)
+    print(f"Packed {len(index)} resources into {args.bundle} ({size} bytes).")
+
+
+if __name__ == "__main__":
+    main()